@@ -1,8 +1,22 @@
 """Reads and writes data from and to an Excel file"""
 
+import sys
 from typing import Any
 
 
+def get_key_cell_value(cell: Any) -> Any:
+    """Returns the value of a header or key cell. String values are interned,
+    since they are used as dictionary keys and looked up in the input tables
+    (with interned keys). Other cells, such as free text, are not interned."""
+
+    value = cell.value
+
+    if isinstance(value, str):
+        return sys.intern(value)
+
+    return value
+
+
 def get_list_item_indices(li: list[str], di: dict[str, str]) -> dict[str, int]:
     """
     Function takes a list of strings and a dictionary. The list contains the values from the dictionary.
@@ -28,7 +42,7 @@ def parse_row_instance(
     Reads an Excelsheet. Every row becomes a dictionary with the keys from the col_dict based on the header_row.
     """
 
-    header_list = [cell.value for cell in sheet[header_row]]
+    header_list = [get_key_cell_value(cell) for cell in sheet[header_row]]
 
     # Check if the column names are unique (there could be None column names, but this is allowed)
     header_list_check = [header for header in header_list if header is not None]
@@ -78,7 +92,7 @@ def parse_row_instance_remainder(
     The values are read from the i + 1 column, where i is the position of the most right column, upto the
     first empty cell.
     """
-    header_list = [cell.value for cell in sheet[header_row]]
+    header_list = [get_key_cell_value(cell) for cell in sheet[header_row]]
     indices = get_list_item_indices(header_list, col_dict)
     max_index = max(indices.values())
 
@@ -126,7 +140,7 @@ def parse_key_row(sheet: Any, skip_rows: int) -> dict:
             continue
 
         # Name is in the first column
-        name = row[0].value
+        name = get_key_cell_value(row[0])
 
         # If a name was filled in, add it to the list
         if not name:
@@ -174,7 +188,7 @@ def parse_key_value_cols(
           as value
         key_dict: dictionary with the key alias as key and the actual key as value"""
 
-    header_list = [cell.value for cell in sheet[header_row]]
+    header_list = [get_key_cell_value(cell) for cell in sheet[header_row]]
     indices = get_list_item_indices(header_list, col_dict)
 
     sheet_dict = {}
@@ -184,7 +198,7 @@ def parse_key_value_cols(
         if i in list(range(skip_rows)):
             continue
 
-        key = row[indices[key_col]].value
+        key = get_key_cell_value(row[indices[key_col]])
         value = row[indices[value_col]].value
 
         if key in sheet_dict.keys():
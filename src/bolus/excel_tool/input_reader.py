@@ -25,15 +25,14 @@ from bolus.toolbox.waternet import WaterLineType
 from bolus.toolbox.waternet_creator import RefLevelType, OffsetType, LineOffsetMethodCollection, LineOffsetMethod, LineOffsetPoint
 from bolus.toolbox.waternet_config import (WaterLevelCollection, HeadLineMethodType, RefLineMethodType, WaterLevelSetConfig, \
                                      HeadLineConfig, ReferenceLineConfig, WaternetConfig, WaternetConfigCollection, WaterLevelSetConfigCollection)
-from bolus.toolbox.calculation_settings import (GridSettingsSetCollection,
+from bolus.toolbox.calculation_settings import (GRID_SETTINGS_BY_SLIP_PLANE_MODEL,
+                                          GridSettingsSetCollection,
                                           GridSettingsSet,
-                                          SlipPlaneModel,
-                                          UpliftVanParticleSwarm,
-                                          BishopBruteForce)
+                                          SlipPlaneModel)
 from bolus.excel_tool.excel_utils import (parse_key_row, parse_key_value_cols,
                                     parse_row_instance)
 from bolus.toolbox.model_creator import GeneralSettings, ModelConfig, UserInputStructure
-from bolus.utils.dict_utils import (group_dicts_by_key,
+from bolus.utils.dict_utils import (group_dicts_by_key, intern_keys,
                               remove_key, check_for_missing_keys)
 from bolus.utils.list_utils import (check_list_of_dicts_for_duplicate_values,
                               unique_in_order)
@@ -338,17 +337,17 @@ REQUIRED_CALCULATION_COLS = [
     "apply_state_points",
 ]
 
-INPUT_TO_BOOL = {
+INPUT_TO_BOOL = intern_keys({
     "Ja": True,
     "Nee": False,
-}
+})
 
-INPUT_TO_CALCULATE_L_COORDINATES = {
+INPUT_TO_CALCULATE_L_COORDINATES = intern_keys({
     "2D": False,
     "3D": True,
-}
+})
 
-INPUT_TO_CHAR_POINTS = {
+INPUT_TO_CHAR_POINTS = intern_keys({
     "Maaiveld buitenwaarts": CharPointType.SURFACE_LEVEL_WATER_SIDE,
     "Teen geul": CharPointType.TOE_CANAL,
     "Insteek geul": CharPointType.START_CANAL,
@@ -367,43 +366,43 @@ INPUT_TO_CHAR_POINTS = {
     "Slootbodem polderzijde": CharPointType.DITCH_BOTTOM_LAND_SIDE,
     "Insteek sloot polderzijde": CharPointType.DITCH_START_LAND_SIDE,
     "Maaiveld binnenwaarts": CharPointType.SURFACE_LEVEL_LAND_SIDE,
-}
+})
 
-INPUT_TO_SIDE = {
+INPUT_TO_SIDE = intern_keys({
     "Binnenwaarts": Side.LAND_SIDE,
     "Buitenwaarts": Side.WATER_SIDE,
-}
+})
 
-INPUT_TO_WATER_LINE_TYPE = {
+INPUT_TO_WATER_LINE_TYPE = intern_keys({
     "Stijghoogtelijn": WaterLineType.HEADLINE,
     "Referentielijn": WaterLineType.REFERENCE_LINE,
-}
+})
 
-INPUT_TO_HEAD_LINE_METHOD_TYPE = {
+INPUT_TO_HEAD_LINE_METHOD_TYPE = intern_keys({
     "Offset methode": HeadLineMethodType.OFFSETS,
     "Afleiden uit vorige stage": HeadLineMethodType.INTERPOLATE_FROM_WATERNET,
     "Handmatige lijn": HeadLineMethodType.CUSTOM_LINE,
-}
+})
 
-INPUT_TO_REF_LINE_METHOD_TYPE = {
+INPUT_TO_REF_LINE_METHOD_TYPE = intern_keys({
     "Offset methode": RefLineMethodType.OFFSETS,
     "Watervoerende laag": RefLineMethodType.AQUIFER,
     "Watervoerende tussenlaag": RefLineMethodType.INTERMEDIATE_AQUIFER,
     "Indringingslengte": RefLineMethodType.INTRUSION,
     "Handmatige lijn": RefLineMethodType.CUSTOM_LINE,
-}
+})
 
-INPUT_TO_SLIP_PLANE_MODEL = {
+INPUT_TO_SLIP_PLANE_MODEL = intern_keys({
     "Uplift Van": SlipPlaneModel.UPLIFT_VAN_PARTICLE_SWARM,
     "Bishop": SlipPlaneModel.BISHOP_BRUTE_FORCE,
-}
+})
 
-INPUT_TO_SEARCH_MODE = {
+INPUT_TO_SEARCH_MODE = intern_keys({
     "Normal": OptionsType.DEFAULT,
     "Thorough": OptionsType.THOROUGH,
-}
+})
 
-INPUT_TO_PATTERN = {
+INPUT_TO_PATTERN = intern_keys({
     "Stip fijn": PersistableShadingTypeEnum.DOT_A,
     "Stip matig": PersistableShadingTypeEnum.DOT_B,
     "Stip grof": PersistableShadingTypeEnum.DOT_C,
@@ -414,15 +413,49 @@ INPUT_TO_PATTERN = {
     "Diagonaal 1 grof": PersistableShadingTypeEnum.DIAGONAL_B,
     "Diagonaal 2 fijn": PersistableShadingTypeEnum.DIAGONAL_C,
     "Diagonaal 2 grof": PersistableShadingTypeEnum.DIAGONAL_D,
-}
+})
+
+INPUT_TO_STRENGTH_MODEL = intern_keys({
+    "Shansep": ShearStrengthModelTypePhreaticLevel.SHANSEP,
+    "Mohr-Coulomb": ShearStrengthModelTypePhreaticLevel.MOHR_COULOMB,
+    "Su Table": ShearStrengthModelTypePhreaticLevel.SUTABLE,
+})
+
+# Keys required for converting a row of soil parameters into a Soil
+REQUIRED_SOIL_PARAM_KEYS = [
+    "name",
+    "unsaturated_weight",
+    "saturated_weight",
+    "strength_model_above",
+    "strength_model_below",
+    "probabilistic_strength_parameters",
+    "c_mean",
+    "c_std",
+    "phi_mean",
+    "phi_std",
+    "psi_mean",
+    "psi_std",
+    "shear_stress_ratio_s_mean",
+    "shear_stress_ratio_s_std",
+    "strength_exponent_m_mean",
+    "strength_exponent_m_std",
+    "probabilistic_pop",
+    "pop_mean",
+    "pop_std",
+    "correlation_s-m",
+    "correlation_c-phi",
+    "consolidation_traffic_load",
+    "color",
+    "pattern",
+]
 
 NAME_PHREATIC_LINE = "Freatisch"
 
-INPUT_TO_REF_LEVEL_TYPE = {
+INPUT_TO_REF_LEVEL_TYPE = intern_keys({
     "NAP": RefLevelType.NAP,
     "Maaiveld": RefLevelType.SURFACE_LEVEL,
     "Verhang t.o.v. voorgaand punt": RefLevelType.RELATED_TO_OTHER_POINT,
-}
+})
 
 
 def check_required_input(
@@ -1019,86 +1052,47 @@ class RawInputToUserInputStructure:
         Args:
             soil_list: list of dictionaries with the soil properties
         """
-        req_keys = [
-            "name",
-            "unsaturated_weight",
-            "saturated_weight",
-            "strength_model_above",
-            "strength_model_below",
-            "probabilistic_strength_parameters",
-            "c_mean",
-            "c_std",
-            "phi_mean",
-            "phi_std",
-            "psi_mean",
-            "psi_std",
-            "shear_stress_ratio_s_mean",
-            "shear_stress_ratio_s_std",
-            "strength_exponent_m_mean",
-            "strength_exponent_m_std",
-            "probabilistic_pop",
-            "pop_mean",
-            "pop_std",
-            "correlation_s-m",
-            "correlation_c-phi",
-            "consolidation_traffic_load",
-            "color",
-            "pattern",
-        ]
-
-        strength_model = {
-            "Shansep": ShearStrengthModelTypePhreaticLevel.SHANSEP,
-            "Mohr-Coulomb": ShearStrengthModelTypePhreaticLevel.MOHR_COULOMB,
-            "Su Table": ShearStrengthModelTypePhreaticLevel.SUTABLE,
-        }
 
         soils: list[Soil] = []
 
         for soil_dict in soil_list:
             # Check that all the required keys are present
-            check_for_missing_keys(soil_dict, req_keys)
+            check_for_missing_keys(soil_dict, REQUIRED_SOIL_PARAM_KEYS)
 
             gl_soil = GLSoil()
             gl_soil.is_probabilistic = soil_dict["probabilistic_strength_parameters"]
             gl_soil.name = soil_dict["name"]
             gl_soil.code = soil_dict["name"]
-            gl_soil.soil_weight_parameters.unsaturated_weight = soil_dict[
-                "unsaturated_weight"
-            ]
-            gl_soil.soil_weight_parameters.saturated_weight = soil_dict[
-                "saturated_weight"
-            ]
-            gl_soil.shear_strength_model_above_phreatic_level = strength_model[
+            gl_soil.soil_weight_parameters.unsaturated_weight = soil_dict["unsaturated_weight"]
+            gl_soil.soil_weight_parameters.saturated_weight = soil_dict["saturated_weight"]
+            gl_soil.shear_strength_model_above_phreatic_level = INPUT_TO_STRENGTH_MODEL[
                 soil_dict["strength_model_above"]
             ]
-            gl_soil.shear_strength_model_below_phreatic_level = strength_model[
+            gl_soil.shear_strength_model_below_phreatic_level = INPUT_TO_STRENGTH_MODEL[
                 soil_dict["strength_model_below"]
             ]
-            gl_soil.mohr_coulomb_parameters.cohesion.mean = soil_dict["c_mean"]
-            gl_soil.mohr_coulomb_parameters.cohesion.standard_deviation = soil_dict["c_std"]
-            gl_soil.mohr_coulomb_parameters.cohesion.is_probabilistic = True if soil_dict["c_std"] else False
-            gl_soil.mohr_coulomb_parameters.friction_angle.mean = soil_dict["phi_mean"]
-            gl_soil.mohr_coulomb_parameters.friction_angle.standard_deviation = soil_dict["phi_std"]
-            gl_soil.mohr_coulomb_parameters.friction_angle.is_probabilistic = True if soil_dict["phi_std"] else False
-            gl_soil.mohr_coulomb_parameters.dilatancy_angle.mean = soil_dict["psi_mean"]
-            gl_soil.mohr_coulomb_parameters.dilatancy_angle.standard_deviation = soil_dict["psi_std"]
-            gl_soil.mohr_coulomb_parameters.dilatancy_angle.is_probabilistic = True if soil_dict["psi_std"] else False
-            gl_soil.undrained_parameters.shear_strength_ratio.mean = soil_dict[
-                "shear_stress_ratio_s_mean"
-            ]
-            gl_soil.undrained_parameters.shear_strength_ratio.standard_deviation = soil_dict["shear_stress_ratio_s_std"]
-            gl_soil.undrained_parameters.shear_strength_ratio.is_probabilistic = True if soil_dict[
-                "shear_stress_ratio_s_std"] else False
-            gl_soil.undrained_parameters.strength_increase_exponent.mean = soil_dict[
-                "strength_exponent_m_mean"
-            ]
-            gl_soil.undrained_parameters.strength_increase_exponent.standard_deviation = soil_dict[
-                "strength_exponent_m_std"]
-            gl_soil.undrained_parameters.strength_increase_exponent.is_probabilistic = True if soil_dict[
-                "strength_exponent_m_std"] else False
-            gl_soil.mohr_coulomb_parameters.cohesion_and_friction_angle_correlated = soil_dict["correlation_c-phi"]
-            gl_soil.undrained_parameters.shear_strength_ratio_and_shear_strength_exponent_correlated = soil_dict[
-                "correlation_s-m"]
+
+            # Bind the parameter groups once instead of resolving them per attribute
+            mc = gl_soil.mohr_coulomb_parameters
+            und = gl_soil.undrained_parameters
+
+            mc.cohesion.mean = soil_dict["c_mean"]
+            mc.cohesion.standard_deviation = soil_dict["c_std"]
+            mc.cohesion.is_probabilistic = True if soil_dict["c_std"] else False
+            mc.friction_angle.mean = soil_dict["phi_mean"]
+            mc.friction_angle.standard_deviation = soil_dict["phi_std"]
+            mc.friction_angle.is_probabilistic = True if soil_dict["phi_std"] else False
+            mc.dilatancy_angle.mean = soil_dict["psi_mean"]
+            mc.dilatancy_angle.standard_deviation = soil_dict["psi_std"]
+            mc.dilatancy_angle.is_probabilistic = True if soil_dict["psi_std"] else False
+            und.shear_strength_ratio.mean = soil_dict["shear_stress_ratio_s_mean"]
+            und.shear_strength_ratio.standard_deviation = soil_dict["shear_stress_ratio_s_std"]
+            und.shear_strength_ratio.is_probabilistic = True if soil_dict["shear_stress_ratio_s_std"] else False
+            und.strength_increase_exponent.mean = soil_dict["strength_exponent_m_mean"]
+            und.strength_increase_exponent.standard_deviation = soil_dict["strength_exponent_m_std"]
+            und.strength_increase_exponent.is_probabilistic = True if soil_dict["strength_exponent_m_std"] else False
+            mc.cohesion_and_friction_angle_correlated = soil_dict["correlation_c-phi"]
+            und.shear_strength_ratio_and_shear_strength_exponent_correlated = soil_dict["correlation_s-m"]
 
             soil = Soil(
                 gl_soil=gl_soil,
@@ -1284,13 +1278,8 @@ class RawInputToUserInputStructure:
               keys and values for the attributes needed for the specific
               slip plane model."""
 
-        slip_plane_model_to_class = {
-            SlipPlaneModel.UPLIFT_VAN_PARTICLE_SWARM: UpliftVanParticleSwarm,
-            SlipPlaneModel.BISHOP_BRUTE_FORCE: BishopBruteForce,
-        }
-
         slip_plane_model = grid_setting_dict["slip_plane_model"]
-        class_ = slip_plane_model_to_class.get(slip_plane_model)
+        class_ = GRID_SETTINGS_BY_SLIP_PLANE_MODEL.get(slip_plane_model)
 
         if class_ is None:
             raise ValueError(f"Unknown slip plane model {slip_plane_model}")
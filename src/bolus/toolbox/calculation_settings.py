@@ -261,6 +261,12 @@ class BishopBruteForce(GridSettings):
         return analysis_method
 
 
+GRID_SETTINGS_BY_SLIP_PLANE_MODEL: dict[SlipPlaneModel, type[GridSettings]] = {
+    SlipPlaneModel.UPLIFT_VAN_PARTICLE_SWARM: UpliftVanParticleSwarm,
+    SlipPlaneModel.BISHOP_BRUTE_FORCE: BishopBruteForce,
+}
+
+
 class GridSettingsSet(BaseModel):
     """Represents a set of grid settings which can be added to a scenario.
     Multiple GridSettings can be useful for finding the minimum
@@ -3,13 +3,13 @@ from math import isclose
 from typing import Literal, Optional
 
 import numpy as np
-from pydantic import BaseModel
-from shapely.geometry import LineString
+from pydantic import BaseModel, PrivateAttr
 import csv
 
 from bolus.utils.dict_utils import remove_key
-from bolus.utils.list_utils import check_list_of_dicts_for_duplicate_values
-from bolus.utils.geometry_utils import geometry_to_points, linear_interpolation
+from bolus.utils.cache_utils import ModelCache
+from bolus.utils.list_utils import check_list_of_dicts_for_duplicate_values, find_by_name
+from bolus.utils.geometry_utils import linear_interpolation
 
 # TODO: Overwegen om validatie methodes toe te voegen.
 #       Als iemand zelf een Geometry maakt is het niet gegarandeerd dat deze correct is.
@@ -101,6 +101,14 @@ class CharPointType(StrEnum):
     SURFACE_LEVEL_LAND_SIDE = auto()
 
 
+# The dictionary keys of the x, y and z-coordinates per CharPointType, as used in
+# CharPointsProfile.from_dict and to_dict
+CHAR_POINT_TYPE_KEYS: tuple[tuple[CharPointType, str, str, str], ...] = tuple(
+    (char_type, f"x_{char_type}", f"y_{char_type}", f"z_{char_type}")
+    for char_type in CharPointType
+)
+
+
 class Side(StrEnum):
     LAND_SIDE = auto()
     WATER_SIDE = auto()
@@ -174,7 +182,8 @@ class ProfileLine(BaseModel):
                 f"Make sure to set the l-coordinates."
             )
 
-        monotonical = np.all(np.diff(l_coords) >= 0) or np.all(np.diff(l_coords) <= 0)
+        steps = np.diff(l_coords)
+        monotonical = (steps >= 0).all() or (steps <= 0).all()
 
         if not monotonical:
             raise ValueError(
@@ -210,9 +219,14 @@ class ProfileLine(BaseModel):
         else:
             shift = 0
 
-        for point in self.points:
-            dist_from_left = point.distance(left_point)
-            point.l = dist_from_left - shift
+        # Distances to the left point in the x-y plane, computed in one go
+        xy = np.array([(point.x, point.y) for point in self.points])
+        dist_from_left = np.sqrt(
+            (xy[:, 0] - left_point.x) ** 2 + (xy[:, 1] - left_point.y) ** 2
+        )
+
+        for point, l in zip(self.points, (dist_from_left - shift).tolist()):
+            point.l = l
 
     def set_x_as_l_coordinates(self):
         """Sets the x-coordinates as the l-coordinates"""
@@ -250,6 +264,8 @@ class CharPointsProfile(ProfileLine):
     name: str
     points: list[CharPoint]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     @classmethod
     def from_dict(
         cls, name: str, char_points_dict: dict[str, float]
@@ -265,10 +281,10 @@ class CharPointsProfile(ProfileLine):
 
         char_points: list[CharPoint] = []
 
-        for char_type in CharPointType:
-            x = float(char_points_dict[f"x_{char_type}"])
-            y = float(char_points_dict[f"y_{char_type}"])
-            z = float(char_points_dict[f"z_{char_type}"])
+        for char_type, x_key, y_key, z_key in CHAR_POINT_TYPE_KEYS:
+            x = float(char_points_dict[x_key])
+            y = float(char_points_dict[y_key])
+            z = float(char_points_dict[z_key])
 
             if x == -1 and y == -1 and z == -1:
                 continue
@@ -296,29 +312,38 @@ class CharPointsProfile(ProfileLine):
 
         char_points_dict: dict[str, float | str] = {"name": self.name}
 
-        for char_type in CharPointType:
-            try:
-                char_point = self.get_point_by_type(char_type)
-            except ValueError:
-                char_point = CharPoint(x=-1, y=-1, z=-1, type=char_type)
+        # Eenmalig opbouwen: een ontbrekend type zou de gecachete zoektabel steeds
+        # opnieuw laten opbouwen. Net als bij get_point_by_type wint het eerste punt.
+        points_by_type: dict[CharPointType, CharPoint] = {}
 
-            char_points_dict[f"x_{char_point.type.value}"] = char_point.x
-            char_points_dict[f"y_{char_point.type.value}"] = char_point.y
-            char_points_dict[f"z_{char_point.type.value}"] = char_point.z
+        for point in self.points:
+            points_by_type.setdefault(point.type, point)
+
+        for char_type, x_key, y_key, z_key in CHAR_POINT_TYPE_KEYS:
+            char_point = points_by_type.get(char_type)
+
+            if char_point is None:
+                char_points_dict[x_key] = char_points_dict[y_key] = char_points_dict[z_key] = -1.0
+            else:
+                char_points_dict[x_key] = char_point.x
+                char_points_dict[y_key] = char_point.y
+                char_points_dict[z_key] = char_point.z
 
         return char_points_dict
 
     def get_point_by_type(self, char_type: CharPointType) -> CharPoint:
-        """Returns the characteristic point of the given type"""
+        """Returns the characteristic point of the given type. If a type occurs
+        more than once, the first point is used."""
 
-        for char_point in self.points:
-            if char_point.type == char_type:
-                return char_point
+        char_point = find_by_name(self._cache, self.points, char_type, name_attr="type")
 
-        raise ValueError(
-            f"Characteristic point of type `{char_type.value}` "
-            f"was not found in profile {self.name}"
-        )
+        if char_point is None:
+            raise ValueError(
+                f"Characteristic point of type `{char_type.value}` "
+                f"was not found in profile {self.name}"
+            )
+
+        return char_point
 
     def determine_l_direction_sign(self, direction: Side) -> int:
         """Determines in which way to move along the l-axis if a displacement
@@ -403,10 +428,12 @@ class SurfaceLineCollection(BaseModel):
 
     surface_lines: list[SurfaceLine]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> SurfaceLine:
         """Returns the SurfaceLine with the given name"""
 
-        profile = next((prof for prof in self.surface_lines if prof.name == name), None)
+        profile = find_by_name(self._cache, self.surface_lines, name)
         if profile:
             return profile
         else:
@@ -481,11 +508,11 @@ class CharPointsProfileCollection(BaseModel):
 
     char_points_profiles: list[CharPointsProfile]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> CharPointsProfile:
         """Returns the CharPointsProfile with the given name"""
-        profile = next(
-            (prof for prof in self.char_points_profiles if prof.name == name), None
-        )
+        profile = find_by_name(self._cache, self.char_points_profiles, name)
         if profile:
             return profile
         else:
@@ -608,8 +635,7 @@ class Geometry(BaseModel):
             of the surface line.
         """
         
-        # Checks
-        self.surface_line.check_l_coordinates_present()
+        # Checks (the monotonic check also raises if l-coordinates are missing)
         self.surface_line.check_l_coordinates_monotonic()
         self.char_point_profile.check_l_coordinates_present()
 
@@ -617,25 +643,33 @@ class Geometry(BaseModel):
         from_point = self.char_point_profile.get_point_by_type(from_char_point)
         to_point = self.char_point_profile.get_point_by_type(to_char_point)
 
-        points: list[Point] = []
+        # The l-coordinates are monotonic, so the points between the characteristic
+        # points form a contiguous part of the surface line (in either orientation)
+        l_min, l_max = sorted((from_point.l, to_point.l))
+        l_coords = np.array([p.l for p in self.surface_line.points])
+        z_coords = np.array([p.z for p in self.surface_line.points])
+        in_section = (l_coords >= l_min) & (l_coords <= l_max)
 
-        for point in self.surface_line.points:
-            # Two conditions, accounting for two possible geometry orientations
-            if (from_point.l <= point.l <= to_point.l) or (from_point.l >= point.l >= to_point.l):
-                points.append(point)
-
-        # Get the intersection of the surface line and the given level
-        l_coords = [p.l for p in points]
-        min_l = min(l_coords)
-        max_l = max(l_coords)
+        if np.count_nonzero(in_section) < 2:
+            raise ValueError(
+                f"Less than two points of the surface line of geometry {self.name} lie "
+                f"between the characteristic points `{from_char_point}` and `{to_char_point}`"
+            )
 
-        shapely_surface_line = LineString([(p.l, p.z) for p in points])
-        shapely_level = LineString([(min_l, level), (max_l, level)])
+        # Get the intersection of the surface line and the given level. The level is
+        # horizontal, so the intersections are the points on the level and the
+        # crossings of the segments, which are determined by linear interpolation
+        l_coords = l_coords[in_section]
+        dz = z_coords[in_section] - level
 
-        intersection = shapely_surface_line.intersection(shapely_level)
-        intersection_points = geometry_to_points(intersection)
+        on_level = l_coords[dz == 0]
+        crossing = np.flatnonzero(dz[:-1] * dz[1:] < 0)
+        l_crossing = l_coords[crossing] + (l_coords[crossing + 1] - l_coords[crossing]) * (
+            dz[crossing] / (dz[crossing] - dz[crossing + 1])
+        )
+        intersection_l_coords = np.concatenate([on_level, l_crossing])
 
-        if len(intersection_points) == 0:
+        if intersection_l_coords.size == 0:
             return None
         
         # Determine which the direction of the l-axis is
@@ -645,21 +679,23 @@ class Geometry(BaseModel):
         # If the l-axis is positive in the search direction, then the right 
         # intersection point is the one with the minimum l-coordinate
         if sign == 1:
-            intersection_point = min(intersection_points, key=lambda p: p.x)
+            intersection_l = intersection_l_coords.min()
         # Otherwise, it is the intersection point with the maximum l-coordinate
         else:
-            intersection_point = max(intersection_points, key=lambda p: p.x)
+            intersection_l = intersection_l_coords.max()
 
         # Return the intersection point
-        return intersection_point.x, intersection_point.y
+        return float(intersection_l), level
 
 
 class GeometryCollection(BaseModel):
     geometries: list[Geometry] = []
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> Geometry:
         """Returns the soil with the given name"""
-        geom = next((geom for geom in self.geometries if geom.name == name), None)
+        geom = find_by_name(self._cache, self.geometries, name)
 
         if geom is None:
             raise NameError(f"Could not find geometry with name `{name}`")
@@ -699,15 +735,15 @@ def create_geometries(
         if char_type_left_point is None:
             raise ValueError("A left point is required if calculate_l_coordinates is True (3D-geometry)")
 
-    surf_names = [surf.name for surf in surface_line_collection.surface_lines]
-    char_names = [char.name for char in char_point_collection.char_points_profiles]
+    surf_names = {surf.name for surf in surface_line_collection.surface_lines}
+    char_names = {char.name for char in char_point_collection.char_points_profiles}
 
-    if set(surf_names) != set(char_names):
+    if surf_names ^ char_names:
         raise ValueError(
             f"Each surface line should have a corresponding characteristic "
             f"point profile and vice versa. This is not the case. "
-            f"Missing in surface lines: {set(char_names) - set(surf_names)} "
-            f"Missing in characteristic points: {set(surf_names) - set(char_names)}"
+            f"Missing in surface lines: {char_names - surf_names} "
+            f"Missing in characteristic points: {surf_names - char_names}"
         )
 
     geometries: list[Geometry] = []
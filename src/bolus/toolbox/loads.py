@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from bolus.toolbox.geometry import CharPointType, Side
+from bolus.utils.cache_utils import ModelCache
+from bolus.utils.list_utils import find_by_name
 
 
 # TODO: LoadBlueprint maken (net als bij revetment)
@@ -32,10 +34,13 @@ class LoadCollection(BaseModel):
 
     loads: list[Load]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> Load:
         """Returns the load with the given name"""
-        for load in self.loads:
-            if load.name == name:
-                return load
+        load = find_by_name(self._cache, self.loads, name)
+
+        if load is not None:
+            return load
 
         raise NameError(f"Could not find load with name {name}")
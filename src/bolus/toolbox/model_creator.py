@@ -2,7 +2,7 @@
 Creates d_stability_toolbox Model objects from the user input
 """
 
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -13,7 +13,7 @@ from bolus.toolbox.loads import LoadCollection
 from bolus.toolbox.model import Model, Scenario, Stage
 from bolus.toolbox.soils import SoilCollection
 from bolus.toolbox.state import create_state_points_from_subsoil
-from bolus.toolbox.subsoil import subsoil_from_soil_profiles, SoilProfileCollection, SoilProfilePositionSetCollection, add_revetment_profile_to_subsoil, RevetmentProfileBlueprintCollection, SubsoilCollection, SubsoilInputType
+from bolus.toolbox.subsoil import subsoil_from_soil_profiles, SoilProfile, SoilProfileCollection, Subsoil, SoilProfilePositionSetCollection, add_revetment_profile_to_subsoil, RevetmentProfileBlueprintCollection, SubsoilCollection, SubsoilInputType
 from bolus.toolbox.waternet import WaterLineCollection, Waternet
 from bolus.toolbox.waternet_creator import LineOffsetMethodCollection, WaternetCreatorInput, WaternetCreator
 from bolus.toolbox.waternet_config import WaterLevelCollection, WaternetConfigCollection, WaterLevelSetConfigCollection
@@ -111,50 +111,72 @@ class UserInputStructure(BaseModel):
     subsoils: Optional[SubsoilCollection] = None  # Tijdelijk optioneel - tot implementatie in invoersheet
     
 
-def create_stage(
+def _subsoil_key(stage_config: StageConfig) -> tuple:
+    """Returns the key of the subsoil of a stage in the stage cache. It consists
+    of the names the subsoil is created from."""
+
+    return (
+        "subsoil",
+        stage_config.geometry_name,
+        stage_config.subsoil_input_type,
+        stage_config.soil_profile_position_name,
+        stage_config.subsoil_name,
+        stage_config.revetment_profile_name,
+    )
+
+
+def _waternet_key(stage_config: StageConfig, previous_waternet_key: Optional[tuple]) -> Optional[tuple]:
+    """Returns the key of the waternet of a stage in the stage cache, or None if
+    the stage has no waternet. A waternet can depend on the waternet of the previous
+    stage, so the key includes the key of the previous waternet."""
+
+    if stage_config.waternet_scenario_name is None:
+        return None
+
+    return (
+        "waternet",
+        _subsoil_key(stage_config),
+        stage_config.waternet_scenario_name,
+        stage_config.water_level_set_name,
+        previous_waternet_key,
+    )
+
+
+def _create_subsoil(
     stage_config: StageConfig,
-    geometries: List[Geometry],
+    geometry: Geometry,
     input_structure: UserInputStructure,
-    previous_waternet: Optional[Waternet] = None,
-) -> Stage:
-    """
-    Creates a Stage object from the provided input.
+    stage_cache: Optional[Dict[tuple, Any]] = None,
+) -> Subsoil:
+    """Creates the subsoil of a stage, including the revetment profile (if any).
 
-    Args:
-        stage_config: Stage configuration.
-        geometries: A list of Geometry objects.
-        input_structure: The user-provided input structure.
-        previous_waternet: The previous waternet. If there is no previous stage, this is None.
+    The created subsoil is stored in stage_cache (if given). A later stage with
+    the same subsoil gets a deep copy of it, so stages don't share a subsoil."""
 
-    Returns:
-        A Stage object.
-    """
-    geometry = next(
-        (geom for geom in geometries if geom.name == stage_config.geometry_name), None
-    )
+    subsoil_key = _subsoil_key(stage_config)
 
-    if geometry is None:
-        raise ValueError(
-            f"Could not find geometry with name {stage_config.geometry_name}"
-        )
+    if stage_cache is not None and subsoil_key in stage_cache:
+        return stage_cache[subsoil_key].model_copy(deep=True)
 
     surface_line = geometry.surface_line
-
     if stage_config.subsoil_input_type == SubsoilInputType.FROM_SOIL_PROFILE_POSITION:
         profile_positions = input_structure.soil_profile_positions.get_by_name(
             stage_config.soil_profile_position_name
         )
 
-        soil_profiles_and_coords = [
-            (input_structure.soil_profiles.get_by_name(position.profile_name), position.l_coord)
-            for position in profile_positions.soil_profile_positions
-        ]
+        get_soil_profile = input_structure.soil_profiles.get_by_name
+        soil_profiles: list[SoilProfile] = []
+        l_coords: list[float | None] = []
+
+        for position in profile_positions.soil_profile_positions:
+            soil_profiles.append(get_soil_profile(position.profile_name))
+            l_coords.append(position.l_coord)
 
         # Create subsoil from the surface line, soil_profiles and the transitions
         subsoil = subsoil_from_soil_profiles(
             surface_line=surface_line,
-            soil_profiles=[sp[0] for sp in soil_profiles_and_coords],
-            transitions=[sp[1] for sp in soil_profiles_and_coords][1:],  # Skip the first coords, it's None
+            soil_profiles=soil_profiles,
+            transitions=l_coords[1:],  # Skip the first coords, it's None
             min_soil_profile_depth=input_structure.settings.min_soil_profile_depth,
         )
     elif stage_config.subsoil_input_type == SubsoilInputType.FROM_SUBSOIL_COLLECTION:
@@ -167,6 +189,11 @@ def create_stage(
                 "Subsoil collection is required when using subsoil input type FROM_SUBSOIL_COLLECTION"
             )
         subsoil = input_structure.subsoils.get_by_name(stage_config.subsoil_name)
+
+        # Het toevoegen van de bekleding past de subsoil aan. Een kopie voorkomt
+        # dat de subsoil in de invoer wordt gewijzigd.
+        if stage_config.revetment_profile_name is not None:
+            subsoil = subsoil.model_copy(deep=True)
     else:
         raise ValueError(
             f"Invalid subsoil input type: {stage_config.subsoil_input_type}"
@@ -187,7 +214,62 @@ def create_stage(
             surface_line=surface_line,
         )
 
-    if stage_config.waternet_scenario_name is not None:
+    if stage_cache is not None:
+        stage_cache[subsoil_key] = subsoil
+
+    return subsoil
+
+
+def create_stage(
+    stage_config: StageConfig,
+    geometries_by_name: Dict[str, Geometry],
+    input_structure: UserInputStructure,
+    previous_waternet: Optional[Waternet] = None,
+    stage_cache: Optional[Dict[tuple, Any]] = None,
+    waternet_key: Optional[tuple] = None,
+) -> Stage:
+    """
+    Creates a Stage object from the provided input.
+
+    The subsoil, waternet and state points are stored in stage_cache, keyed by
+    the names they are created from. A later stage with the same configuration
+    does not create them again, but gets a deep copy of the stored object. Changing
+    the subsoil, waternet or state points of one stage does not affect the others.
+
+    Args:
+        stage_config: Stage configuration.
+        geometries_by_name: Dictionary with the Geometry objects by name.
+        input_structure: The user-provided input structure.
+        previous_waternet: The previous waternet. If there is no previous stage, this is None.
+        stage_cache: Optional. Dictionary to share the created objects between stages.
+          If None, nothing is shared.
+        waternet_key: Optional. The key of the waternet in stage_cache (see _waternet_key),
+          which depends on the previous stages. If None, the waternet is not cached.
+
+    Returns:
+        A Stage object.
+    """
+    geometry = geometries_by_name.get(stage_config.geometry_name)
+
+    if geometry is None:
+        raise ValueError(
+            f"Could not find geometry with name {stage_config.geometry_name}"
+        )
+
+    subsoil = _create_subsoil(
+        stage_config=stage_config,
+        geometry=geometry,
+        input_structure=input_structure,
+        stage_cache=stage_cache,
+    )
+
+    if stage_config.waternet_scenario_name is None:
+        waternet = None
+
+    elif stage_cache is not None and waternet_key in stage_cache:
+        waternet = stage_cache[waternet_key].model_copy(deep=True)
+
+    else:
         waternet_config = input_structure.waternet_configs.get_by_name(
             stage_config.waternet_scenario_name
         )
@@ -205,8 +287,8 @@ def create_stage(
         waternet_creator = WaternetCreator(input=waternet_creator_input)
         waternet = waternet_creator.create_waternet()
 
-    else:
-        waternet = None
+        if stage_cache is not None and waternet_key is not None:
+            stage_cache[waternet_key] = waternet
 
     load = (
         input_structure.loads.get_by_name(stage_config.load_name)
@@ -215,13 +297,24 @@ def create_stage(
     )
 
     # Create the state points
-    state_points = (
-        create_state_points_from_subsoil(
+    state_points_key = ("state_points", _subsoil_key(stage_config))
+
+    if not stage_config.apply_state_points:
+        state_points = None
+
+    elif stage_cache is not None and state_points_key in stage_cache:
+        state_points = [
+            state_point.model_copy(deep=True)
+            for state_point in stage_cache[state_points_key]
+        ]
+
+    else:
+        state_points = create_state_points_from_subsoil(
             subsoil=subsoil, soil_collection=input_structure.soils, state_type="POP"
         )
-        if stage_config.apply_state_points
-        else None
-    )
+
+        if stage_cache is not None:
+            stage_cache[state_points_key] = state_points
 
     # Create the stage
     return Stage(
@@ -237,34 +330,41 @@ def create_stage(
 
 def create_scenario(
     scenario_config: ScenarioConfig,
-    geometries: List[Geometry],
+    geometries_by_name: Dict[str, Geometry],
     input_structure: UserInputStructure,
+    stage_cache: Optional[Dict[tuple, Any]] = None,
 ) -> Scenario:
     """
     Creates a Scenario object from the provided input.
 
     Args:
         scenario_config: Scenario configuration.
-        geometries: A list of Geometry objects.
+        geometries_by_name: Dictionary with the Geometry objects by name.
         input_structure: The user-provided input structure.
+        stage_cache: Optional. Dictionary to share the created objects between stages.
 
     Returns:
         A Scenario object."""
     
     stages: list[Stage] = []
+    waternet_key: Optional[tuple] = None
 
     for stage_config in scenario_config.stages:
         if len(stages) > 0:
             previous_waternet = stages[-1].waternet
         else:
             previous_waternet = None
-        
+
+        waternet_key = _waternet_key(stage_config, previous_waternet_key=waternet_key)
+
         stages.append(
             create_stage(
                 stage_config=stage_config,
-                geometries=geometries,
+                geometries_by_name=geometries_by_name,
                 input_structure=input_structure,
                 previous_waternet=previous_waternet,
+                stage_cache=stage_cache,
+                waternet_key=waternet_key,
             )
         )
 
@@ -302,13 +402,24 @@ def input_to_models(input_structure: UserInputStructure) -> List[Model]:
         calculate_l_coordinates=input_structure.settings.calculate_l_coordinates,
     )
 
+    # Eén keer een opzoektabel maken, i.p.v. per stage door de lijst te lopen.
+    # Bij dubbele namen wint (net als voorheen) de eerste geometrie.
+    geometries_by_name: Dict[str, Geometry] = {}
+
+    for geometry in geometries:
+        geometries_by_name.setdefault(geometry.name, geometry)
+
     # Create a Model for each calculation dictionary
     print("Preprocessing...")
     for model_config in input_structure.model_configs:
         print(model_config.calc_name)
+
+        # Stages met dezelfde invoer binnen een model hoeven de subsoil, waternet
+        # en state points maar één keer te maken
+        stage_cache: Dict[tuple, Any] = {}
         scenarios = [
             create_scenario(
-                scenario, geometries, input_structure
+                scenario, geometries_by_name, input_structure, stage_cache
             )
             for scenario in model_config.scenarios
         ]
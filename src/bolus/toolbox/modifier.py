@@ -9,7 +9,7 @@ from geolib.models.dstability.loads import Consolidation, UniformLoad
 from geolib.models.dstability.states import (DStabilityStatePoint,
                                              DStabilityStress,
                                              PersistableStochasticParameter)
-from shapely import Point
+from shapely import Point, prepare
 
 from bolus.toolbox.calculation_settings import (BishopBruteForce,
                                           UpliftVanParticleSwarm)
@@ -129,12 +129,15 @@ def add_state_points(
         dm=dm, scenario_index=scenario_index, stage_index=stage_index
     )
 
+    # Every polygon is checked for every state point. Preparing the polygons
+    # once makes these repeated contains checks cheaper.
+    polygons = [soil_polygon.to_shapely() for soil_polygon in subsoil.soil_polygons]
+    prepare(polygons)
+
     for state_point in state_points:
         point = Point((state_point.x, state_point.z))
 
-        for soil_polygon in subsoil.soil_polygons:
-            polygon = soil_polygon.to_shapely()
-
+        for soil_polygon, polygon in zip(subsoil.soil_polygons, polygons):
             if polygon.contains(point):
                 if state_point.probabilistic_pop is True:
                     stochastic_parameter = PersistableStochasticParameter(
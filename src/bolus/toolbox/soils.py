@@ -2,7 +2,10 @@ from typing import Optional, Self
 
 from geolib.soils.soil import Soil as GLSoil
 from geolib.models.dstability.internal import PersistableShadingTypeEnum
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
+
+from bolus.utils.cache_utils import ModelCache
+from bolus.utils.list_utils import find_by_name
 
 class Soil(BaseModel):
     """Represents a soil type.
@@ -53,9 +56,11 @@ class SoilCollection(BaseModel):
     name: Optional[str] = None
     soils: list[Soil]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> Soil:
         """Returns the soil with the given name"""
-        soil = next((soil for soil in self.soils if soil.gl_soil.name == name), None)
+        soil = find_by_name(self._cache, self.soils, name, name_attr="gl_soil.name")
 
         if soil is None:
             raise NameError(f"Could not find soil with name {name}")
@@ -1,16 +1,19 @@
 from typing import Optional, Self
 from enum import StrEnum, auto
 
+import numpy as np
+import shapely
 from geolib import DStabilityModel
 from geolib.geometry.one import Point as GLPoint
-from geolib.models.dstability.internal import PersistableLayer
-from pydantic import BaseModel, model_validator
+from geolib.models.dstability.internal import PersistableLayer, PersistableSoil
+from pydantic import BaseModel, PrivateAttr, model_validator
 from shapely.geometry import Polygon, LineString, GeometryCollection, MultiPolygon
 from shapely.ops import split, unary_union
 
-from bolus.toolbox.geolib_utils import get_by_id
 from bolus.toolbox.geometry import SurfaceLine, CharPointType, CharPointsProfile
 from bolus.utils.geometry_utils import geometry_to_polygons, is_valid_polygon
+from bolus.utils.cache_utils import ModelCache
+from bolus.utils.list_utils import find_by_name
 
 
 # TODO: Zou mooi zijn om een baseclass voor collections te maken. Dan
@@ -77,10 +80,14 @@ class SoilProfilePositionSet(BaseModel):
     set_name: str
     soil_profile_positions: list[SoilProfilePosition]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> SoilProfilePosition:
         """Returns the SoilProfilePosition with the given name"""
 
-        position = next((pos for pos in self.soil_profile_positions if pos.profile_name == name), None)
+        position = find_by_name(
+            self._cache, self.soil_profile_positions, name, name_attr="profile_name"
+        )
 
         if position:
             return position
@@ -96,10 +103,12 @@ class SoilProfilePositionSetCollection(BaseModel):
 
     sets: list[SoilProfilePositionSet]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> SoilProfilePositionSet:
         """Returns the SoilProfilePositionSet with the given name"""
 
-        position_set = next((set for set in self.sets if set.set_name == name), None)
+        position_set = find_by_name(self._cache, self.sets, name, name_attr="set_name")
 
         if position_set:
             return position_set
@@ -112,10 +121,12 @@ class SoilProfileCollection(BaseModel):
 
     profiles: list[SoilProfile]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> SoilProfile:
         """Returns the SoilProfile with the given name"""
 
-        profile = next((prof for prof in self.profiles if prof.name == name), None)
+        profile = find_by_name(self._cache, self.profiles, name)
 
         if profile:
             return profile
@@ -144,6 +155,8 @@ class SoilPolygon(BaseModel):
     is_aquifer: Optional[bool] = None
     name: Optional[str] = None
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     @classmethod
     def from_geolib_layer(cls, gl_layer: PersistableLayer, soil_type: str) -> Self:
         """Creates a SoilPolygon from a GEOLib PersistableLayer"""
@@ -165,12 +178,96 @@ class SoilPolygon(BaseModel):
                 f"Input must be a Shapely Polygon but is of type {type(polygon)}"
             )
 
-        points = list(polygon.exterior.coords)[:-1]  # Remove the repeated first point
+        # Coordinaten als array ophalen is sneller dan via de CoordinateSequence
+        points = shapely.get_coordinates(polygon.exterior)[:-1].tolist()  # Remove the repeated first point
         return cls(soil_type=soil_type, points=points)
 
     def to_shapely(self) -> Polygon:
-        """Creates a Shapely Polygon from the SoilPolygon"""
-        return Polygon(self.points)
+        """Creates a Shapely Polygon from the SoilPolygon.
+
+        The polygon is cached and rebuilt when the points have changed."""
+
+        polygon = self._get_cached_shapely()
+
+        if polygon is None:
+            polygon = Polygon(np.array(self.points, dtype=float))
+            self._cache["shapely"] = (list(self.points), polygon)
+
+        return polygon
+
+    def _get_cached_shapely(self) -> Optional[Polygon]:
+        """Returns the cached Shapely Polygon, or None if there is none or
+        if the points have changed since it was created"""
+
+        cached = self._cache.get("shapely")
+
+        # Ongewijzigde punten zijn dezelfde tuples, dus de vergelijking is snel
+        if cached is not None and cached[0] == self.points:
+            return cached[1]
+
+        return None
+
+    def canonical_points(self) -> tuple[tuple[float, float], ...]:
+        """Returns the points in a canonical order: starting at the lowest
+        point (sorted on x, then z) and in the direction of the smallest
+        neighbouring point. Two SoilPolygons describing the same ring of points,
+        but with a different starting point or orientation, have equal
+        canonical points.
+
+        Returns:
+            A tuple with the points in canonical order"""
+
+        points = [tuple(point) for point in self.points]
+
+        if len(points) < 3:
+            return tuple(points)
+
+        i_start = min(range(len(points)), key=points.__getitem__)
+        rotated = points[i_start:] + points[:i_start]
+
+        # Orientatie gelijk trekken: verder langs de kleinste buur
+        if rotated[-1] < rotated[1]:
+            rotated = [rotated[0]] + rotated[:0:-1]
+
+        return tuple(rotated)
+
+    @staticmethod
+    def to_shapely_many(soil_polygons: list["SoilPolygon"]) -> list[Polygon]:
+        """Creates Shapely Polygons from multiple SoilPolygons. Cached polygons
+        (see to_shapely) are reused. The other polygons are constructed in a single
+        call to Shapely, which is faster than calling to_shapely for each polygon,
+        and are added to the cache.
+
+        Args:
+            soil_polygons: The SoilPolygons to convert
+
+        Returns:
+            A list of Shapely Polygons in the same order as the soil polygons"""
+
+        if not soil_polygons:
+            return []
+
+        polygons = [soil_polygon._get_cached_shapely() for soil_polygon in soil_polygons]
+        missing = [i for i, polygon in enumerate(polygons) if polygon is None]
+
+        if not missing:
+            return polygons
+
+        coords = np.array(
+            [point for i in missing for point in soil_polygons[i].points],
+            dtype=np.float64
+        )
+        indices = np.repeat(
+            np.arange(len(missing)),
+            [len(soil_polygons[i].points) for i in missing]
+        )
+        rings = shapely.linearrings(coords, indices=indices)
+
+        for i, polygon in zip(missing, shapely.polygons(rings)):
+            soil_polygons[i]._cache["shapely"] = (list(soil_polygons[i].points), polygon)
+            polygons[i] = polygon
+
+        return polygons
 
 
 class Subsoil(BaseModel):
@@ -186,6 +283,8 @@ class Subsoil(BaseModel):
     soil_polygons: list[SoilPolygon]
     name: Optional[str] = None
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     @classmethod
     def from_geolib(
         cls, 
@@ -204,9 +303,26 @@ class Subsoil(BaseModel):
 
         soil_polygons: list[SoilPolygon] = []
 
+        # Eenmalig opzoektabellen maken, i.p.v. per laag door de lijsten te lopen.
+        # Net als bij get_by_id en get_layer wint het eerste item met een id.
+        soils_by_id: dict[str, PersistableSoil] = {}
+        layers_by_id: dict[str, PersistableLayer] = {}
+
+        for soil in dm.soils.Soils:
+            soils_by_id.setdefault(soil.Id, soil)
+
+        for layer in geometry.Layers:
+            layers_by_id.setdefault(layer.Id, layer)
+
         for soil_layer in soil_layers.SoilLayers:
-            soil = get_by_id(collection=dm.soils.Soils, item_id=soil_layer.SoilId)
-            layer = geometry.get_layer(id=soil_layer.LayerId)
+            soil = soils_by_id.get(soil_layer.SoilId)
+            layer = layers_by_id.get(str(soil_layer.LayerId))
+
+            if soil is None:
+                raise ValueError(f"Soil id {soil_layer.SoilId} not found in the model")
+
+            if layer is None:
+                raise ValueError(f"Layer id {soil_layer.LayerId} not found in this geometry")
 
             if use_soil_name:
                 soil_type = soil.Name
@@ -236,17 +352,31 @@ class Subsoil(BaseModel):
         # Create a single polygon from the list of polygons to remove
         remove_polygon = unary_union([polygon for polygon in remove_polygons])
 
-        # Loop through all soil polygons in the subsoil
-        for soil_polygon in self.soil_polygons:
-            soil_polygon_shapely = soil_polygon.to_shapely()
+        # Use a spatial index to determine which soil polygons intersect with
+        # the polygon to remove. Only these need to be clipped.
+        soil_polygons_shapely = SoilPolygon.to_shapely_many(self.soil_polygons)
+        tree = shapely.STRtree(soil_polygons_shapely)
+        intersecting = tree.query(remove_polygon, predicate="intersects").tolist()
+
+        # Clip the intersecting soil polygons in one go
+        clipped_polygons = dict(
+            zip(
+                intersecting,
+                shapely.difference(
+                    [soil_polygons_shapely[i] for i in intersecting], remove_polygon
+                ),
+            )
+        )
 
+        # Loop through all soil polygons in the subsoil
+        for i, soil_polygon in enumerate(self.soil_polygons):
             # Set should_keep to True initially
             should_keep = True
 
             # Check if the soil polygon intersects with the polygon to remove
-            if soil_polygon_shapely.intersects(remove_polygon):
+            if i in clipped_polygons:
                 should_keep = False
-                clipped_polygon = soil_polygon_shapely.difference(remove_polygon)
+                clipped_polygon = clipped_polygons[i]
 
                 # Handle different geometry types
                 if isinstance(clipped_polygon, (GeometryCollection, MultiPolygon)):
@@ -271,11 +401,38 @@ class Subsoil(BaseModel):
 
         # Replace the old list with the new one
         self.soil_polygons = new_soil_polygons
+        self._cache.clear()
+
+    def add_polygons(self, soil_polygons: list[SoilPolygon]) -> None:
+        """Adds soil polygons to the subsoil. This method modifies the subsoil in place.
+
+        Args:
+            soil_polygons (list[SoilPolygon]): The soil polygons to add"""
+
+        self.soil_polygons.extend(soil_polygons)
+        self._cache.clear()
 
     def get_bottom(self) -> float:
-        """Returns the minimim z-coordinate of the subsoil"""
+        """Returns the minimim z-coordinate of the subsoil.
+
+        The result is cached. The cache is cleared by the methods that change
+        the soil polygons (remove_polygons and add_polygons) and is not used
+        when the soil_polygons list was replaced or changed in length. Changing
+        the points of a soil polygon directly is not detected."""
+
+        cached = self._cache.get("bottom")
 
-        return min(point[1] for polygon in self.soil_polygons for point in polygon.points)
+        if (
+            cached is not None
+            and cached[0] is self.soil_polygons
+            and cached[1] == len(self.soil_polygons)
+        ):
+            return cached[2]
+
+        bottom = min(point[1] for polygon in self.soil_polygons for point in polygon.points)
+        self._cache["bottom"] = (self.soil_polygons, len(self.soil_polygons), bottom)
+
+        return bottom
 
 
 class SubsoilCollection(BaseModel):
@@ -283,10 +440,12 @@ class SubsoilCollection(BaseModel):
 
     subsoils: list[Subsoil]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> Subsoil:
         """Returns the Subsoil with the given name"""
 
-        subsoil = next((subsoil for subsoil in self.subsoils if subsoil.name == name), None)
+        subsoil = find_by_name(self._cache, self.subsoils, name)
 
         if subsoil:
             return subsoil
@@ -309,25 +468,35 @@ class RevetmentLayer(BaseModel):
     thickness: float
     l_coords: tuple[float, float]
 
-    def to_soil_polygon(self, surface_line: SurfaceLine) -> SoilPolygon:
+    def to_soil_polygon(
+        self,
+        surface_line: SurfaceLine,
+        shapely_surface_line: Optional[LineString] = None,
+    ) -> SoilPolygon:
         """Returns a SoilPolygon instance representing the revetment layer
         
         Args:
             surface_line (SurfaceLine): The surface line of the subsoil. The surface
               should contain the l-coordinates of the points.
+            shapely_surface_line (LineString): Optional. The surface line as a Shapely
+              LineString in the l-z plane. Can be passed to reuse it for multiple layers.
+              If not given, it is created from the surface line.
 
         Returns:
             SoilPolygon: The SoilPolygon instance representing the revetment layer
         """
 
-        shapely_surface_line = LineString([(p.l, p.z) for p in surface_line.points])
+        if shapely_surface_line is None:
+            shapely_surface_line = LineString([(p.l, p.z) for p in surface_line.points])
 
         # Buffer the surface line by the thickness of the revetment layer
         buffer = shapely_surface_line.buffer(distance=self.thickness, cap_style='square')
 
-        # Create a helper polygon to clip the buffered to the defined l-coordinates
-        helper_top = max(p.z for p in surface_line.points) + 1
-        helper_bottom = min(p.z for p in surface_line.points) - 100
+        # Create a helper polygon to clip the buffered to the defined l-coordinates.
+        # The bounds of the line give the minimum and maximum z of the surface line.
+        _, z_min, _, z_max = shapely_surface_line.bounds
+        helper_top = z_max + 1
+        helper_bottom = z_min - 100
         helper_left = min(self.l_coords)
         helper_right = max(self.l_coords)
         helper_polygon = Polygon(
@@ -373,8 +542,13 @@ class RevetmentProfile(BaseModel):
 
         soil_polygons: list[SoilPolygon] = []
 
+        # Eenmalig de LineString maken voor alle lagen
+        shapely_surface_line = LineString([(p.l, p.z) for p in surface_line.points])
+
         for layer in self.layers:
-            soil_polygon = layer.to_soil_polygon(surface_line=surface_line)
+            soil_polygon = layer.to_soil_polygon(
+                surface_line=surface_line, shapely_surface_line=shapely_surface_line
+            )
             soil_polygons.append(soil_polygon)
 
         return soil_polygons
@@ -460,13 +634,12 @@ class RevetmentProfileBlueprintCollection(BaseModel):
 
     profile_blueprints: list[RevetmentProfileBlueprint]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     def get_by_name(self, name: str) -> RevetmentProfileBlueprint:
         """Returns the RevetmentProfileBlueprint with the given name"""
 
-        profile_blueprint = next(
-            (profile_blueprint for profile_blueprint in self.profile_blueprints if profile_blueprint.name == name),
-            None
-            )
+        profile_blueprint = find_by_name(self._cache, self.profile_blueprints, name)
         if profile_blueprint:
             return profile_blueprint
         else:
@@ -531,7 +704,7 @@ def subsoil_from_soil_profiles(
         + [(p.l, p.z) for p in surface_line.points]
         + [(surface_line.points[-1].l, -100)]
     )
-    geometry_polygon = Polygon(geometry_points)
+    geometry_polygon = Polygon(np.array(geometry_points, dtype=float))
     soil_polygons: list[SoilPolygon] = []
 
     for i, soil_profile in enumerate(soil_profiles):
@@ -550,12 +723,9 @@ def subsoil_from_soil_profiles(
             else:
                 bottom = soil_profile.layers[j + 1].top
 
-            polygon = Polygon(
-                [(left, top), (right, top), (right, bottom), (left, bottom)]
-            )
-
-            # Adjust for the surface level
-            geometry = polygon.intersection(geometry_polygon)
+            # Adjust for the surface level. Clipping by a rectangle is cheaper
+            # than a general intersection with a box-shaped polygon.
+            geometry = shapely.clip_by_rect(geometry_polygon, left, bottom, right, top)
             polygons = geometry_to_polygons(geometry)
 
             for polygon in polygons:
@@ -592,10 +762,10 @@ def add_revetment_profile_to_subsoil(
     revetment_polygons = revetment_profile.to_soil_polygons(surface_line=surface_line)
 
     # Subtract the revetment polygons from the subsoil (so they don't overlap)
-    remove_polygons = [polygon.to_shapely() for polygon in revetment_polygons]
+    remove_polygons = SoilPolygon.to_shapely_many(revetment_polygons)
     subsoil.remove_polygons(remove_polygons)
 
     # Add the revetment polygons to the subsoil
-    subsoil.soil_polygons.extend(revetment_polygons)
+    subsoil.add_polygons(revetment_polygons)
 
     return subsoil
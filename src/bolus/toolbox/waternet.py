@@ -1,9 +1,10 @@
 from enum import StrEnum, auto
 from typing import Optional, Self
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 import numpy as np
 
-from bolus.utils.geometry_utils import linear_interpolation
+from bolus.utils.cache_utils import ModelCache
+from bolus.utils.geometry_utils import interpolate_increasing, interpolation_arrays
 
 
 class WaterLineType(StrEnum):
@@ -27,6 +28,8 @@ class WaterLine(BaseModel):
     l: list[float]
     z: list[float]
 
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
     @model_validator(mode="after")
     def validate_equal_length_l_z(self):
         if len(self.l) != len(self.z):
@@ -42,7 +45,9 @@ class WaterLine(BaseModel):
         """Validate if points are ordered. This is not strictly necessary for 
         D-Stability and is meant as a sanity check."""
 
-        if not np.all(np.diff(self.l) >= 0) and not np.all(np.diff(self.l) <= 0):
+        steps = np.diff(self.l)
+
+        if not (steps >= 0).all() and not (steps <= 0).all():
             raise ValueError(
                 f"Not all the l-coordinates of water line {self.name} of type {type(self)} "
                 f"are monotonically increasing or decreasing. Equal values are allowed. "
@@ -52,7 +57,7 @@ class WaterLine(BaseModel):
         
         return self
 
-    def get_z_at_l(self, l: float) -> float:
+    def get_z_at_l(self, l: float | np.ndarray) -> float | np.ndarray:
         """Returns the z-coordinate at a given l-coordinate
         based on interpolation of the l and z coordinates.
 
@@ -60,17 +65,33 @@ class WaterLine(BaseModel):
         Equal values are NOT allowed.
         
         Args:
-            l (float): The l-coordinate
+            l (float | np.ndarray): The l-coordinate, or an array of l-coordinates
             
         Returns:
-            float: The interpolated z-coordinate at the given l-coordinate
+            float | np.ndarray: The interpolated z-coordinate(s) at the given l-coordinate(s)
             
         Raises:
             ValueError: If l is outside the range of l-coordinates.
 
         """
 
-        return linear_interpolation(x=l, xp=self.l, fp=self.z)
+        z = interpolate_increasing(l, *self._get_interpolation_arrays())
+
+        return float(z) if z.ndim == 0 else z
+
+    def _get_interpolation_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the l and z coordinates as arrays for interpolation. The
+        arrays are cached and recreated when the l or z coordinates have changed."""
+
+        cached = self._cache.get("interpolation")
+
+        if cached is not None and cached[0] == self.l and cached[1] == self.z:
+            return cached[2], cached[3]
+
+        l_arr, z_arr = interpolation_arrays(xp=self.l, fp=self.z)
+        self._cache["interpolation"] = (list(self.l), list(self.z), l_arr, z_arr)
+
+        return l_arr, z_arr
 
     @classmethod
     def from_list(cls, name: str, point_list: list[float]) -> Self:
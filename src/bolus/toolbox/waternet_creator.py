@@ -9,7 +9,7 @@ from bolus.toolbox.geometry import Geometry
 from bolus.toolbox.geometry import SurfaceLine
 from bolus.toolbox.geometry import Side
 from bolus.toolbox.waternet import HeadLine, ReferenceLine, Waternet, WaterLineCollection
-from bolus.toolbox.subsoil import Subsoil
+from bolus.toolbox.subsoil import SoilPolygon, Subsoil
 from bolus.toolbox.waternet_config import WaterLevelCollection, HeadLineMethodType, RefLineMethodType, HeadLineConfig, \
     ReferenceLineConfig, WaternetConfig, WaterLevelSetConfig
 from bolus.utils.geometry_utils import get_polygon_top_or_bottom, geometry_to_polygons, offset_line, simplify_line
@@ -302,7 +302,7 @@ def get_aquifers_from_subsoil(subsoil: Subsoil, geometry: Geometry) -> list[Aqui
     # Get the aquifers from the subsoil
     aquifer_polygons: list[Polygon] = []
     soil_polygons = [sp for sp in subsoil.soil_polygons if sp.is_aquifer]
-    polygons = [sp.to_shapely() for sp in soil_polygons]
+    polygons = SoilPolygon.to_shapely_many(soil_polygons)
 
     # unify attached aquifers
     union = unary_union(polygons)
@@ -0,0 +1,36 @@
+"""Module with a cache for derived data on pydantic models"""
+
+from typing import Any
+
+
+class ModelCache(dict):
+    """Dictionary for caching data derived from the fields of a pydantic model,
+    such as lookups or Shapely geometries. It is meant to be used as a private
+    attribute of the model:
+
+        _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
+    Pydantic compares private attributes in __eq__ and copies them with the model.
+    The cache is not part of the state of the model, therefore:
+      - two caches always compare equal, so a model with cached data is equal
+        to the same model without cached data;
+      - a copy of a cache is empty, so a deep copy of a model does not start
+        with data derived from the original. A shallow copy (model_copy()) shares
+        the cache, just like it shares the field values.
+
+    A cached entry does not update itself. It should be checked against the
+    data it is derived from, or be removed by the methods that change that data."""
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ModelCache)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> "ModelCache":
+        return type(self)()
+
+    def __deepcopy__(self, memo: dict) -> "ModelCache":
+        return type(self)()
@@ -1,5 +1,6 @@
 """Module with helper functions for dictionaries"""
 
+import sys
 from typing import Any
 
 
@@ -22,6 +23,19 @@ def remove_key(d: dict[Any, Any], key: Any) -> dict[Any, Any]:
     return d
 
 
+def intern_keys(d: dict[str, Any]) -> dict[str, Any]:
+    """Returns a copy of the dictionary with interned string keys. Lookups with
+    interned strings (e.g. key cells from the input reader) then match on identity.
+
+    Args:
+        d: dictionary with string keys
+
+    Returns:
+        dictionary with the same items and interned keys"""
+
+    return {sys.intern(key): value for key, value in d.items()}
+
+
 def group_dicts_by_key(
     dicts: list[dict[Any, Any]], group_by_key: str, remove_group_key: bool = True
 ) -> dict[Any, list[dict[Any, Any]]]:
@@ -44,16 +58,16 @@ def group_dicts_by_key(
 
 
     """
-    target_keys = set(d[group_by_key] for d in dicts)
-    grouped_dict = {k: [d for d in dicts if d[group_by_key] == k] for k in target_keys}
+    # Eén keer door de dictionaries lopen, i.p.v. een keer per unieke key
+    grouped_dict: dict[Any, list[dict[Any, Any]]] = {}
+
+    for d in dicts:
+        grouped_dict.setdefault(d[group_by_key], []).append(d)
 
     # De group_by_key verwijderen uit de dictionaries binnen de groep. De group_by_key is nu de key van de grouped_dict
     if remove_group_key:
-        for key in grouped_dict:
-            group = grouped_dict[key]
-
-            for group_item in group:
-                group_item.pop(group_by_key)
+        for d in dicts:
+            d.pop(group_by_key)
 
     return grouped_dict
 
@@ -1,19 +1,22 @@
+import os
 from pathlib import Path
+from typing import Iterator
 
 
-def get_files_by_extension(
+def iter_files_by_extension(
     directory: str, file_ext: str, search_sub_dir: bool = False
-) -> list[dict[str, str]]:
+) -> Iterator[dict[str, str]]:
     """
-    Searches through a directory for files with the specified file extension.
+    Iterates through a directory and yields the files with the specified file extension.
+    Directories with a name that ends in the extension are skipped.
 
     Args:
       directory (str): Path to the folder (may contain subfolders).
       file_ext (str): File extension (without or without dot).
       search_sub_dir (bool): Whether to search subdirectories as well. Default is False.
 
-    Returns:
-      list[dict[str, str]]: List of dictionaries with 'name' and 'path' keys.
+    Yields:
+      dict[str, str]: Dictionary with 'name' and 'path' keys.
     """
 
     dir_path = Path(directory)
@@ -25,12 +28,47 @@ def get_files_by_extension(
     if not file_ext:
         raise ValueError("File extension cannot be empty")
 
-    file_ext = file_ext.lstrip(".").casefold()  # Normalize extension
+    suffix = os.path.normcase("." + file_ext.lstrip(".").casefold())  # Normalize extension
+
+    yield from _scan_directory(str(dir_path), suffix, search_sub_dir)
+
+
+def _scan_directory(
+    directory: str, suffix: str, search_sub_dir: bool
+) -> Iterator[dict[str, str]]:
+    """Yields the files in the directory that end in the suffix, followed by
+    those in the subdirectories (depth-first) if search_sub_dir is True. Names
+    are compared with os.path.normcase, so the matching is case-insensitive on
+    Windows and case-sensitive on other platforms, as with Path.glob."""
+
+    sub_dirs = []
+
+    # os.scandir geeft het bestandstype mee, zodat er geen extra stat per bestand nodig is
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.normcase(entry.name).endswith(suffix):
+                yield {"name": entry.name, "path": entry.path}
+
+            elif search_sub_dir and entry.is_dir(follow_symlinks=False):
+                sub_dirs.append(entry.path)
+
+    for sub_dir in sub_dirs:
+        yield from _scan_directory(sub_dir, suffix, search_sub_dir)
+
 
-    file_list = []
-    search_func = dir_path.rglob if search_sub_dir else dir_path.glob
+def get_files_by_extension(
+    directory: str, file_ext: str, search_sub_dir: bool = False
+) -> list[dict[str, str]]:
+    """
+    Searches through a directory for files with the specified file extension.
 
-    for file in search_func(f"*.{file_ext}"):
-        file_list.append({"name": file.name, "path": str(file)})
+    Args:
+      directory (str): Path to the folder (may contain subfolders).
+      file_ext (str): File extension (without or without dot).
+      search_sub_dir (bool): Whether to search subdirectories as well. Default is False.
+
+    Returns:
+      list[dict[str, str]]: List of dictionaries with 'name' and 'path' keys.
+    """
 
-    return file_list
+    return list(iter_files_by_extension(directory, file_ext, search_sub_dir))
@@ -1,4 +1,5 @@
 import numpy as np
+import shapely
 from shapely import GeometryCollection, MultiPolygon, Point, Polygon, LineString, MultiLineString, MultiPoint, \
     LinearRing
 from shapely.ops import orient
@@ -50,12 +51,13 @@ def geometry_to_points(geometry: GeometryType) -> list[Point]:
         if isinstance(current, Point):
             points.append(current)
 
+        # The points of lines and rings are created in one call to Shapely
         elif isinstance(current, LinearRing):
-            points.extend([Point(x, y) for x, y in current.coords[:-1]])  # The last point is repeated
+            points.extend(shapely.points(shapely.get_coordinates(current)[:-1]).tolist())  # The last point is repeated
 
         # If the current geometry is a line, add its points to the list
         elif isinstance(current, LineString):
-            points.extend([Point(x, y) for x, y in current.coords])
+            points.extend(shapely.points(shapely.get_coordinates(current)).tolist())
 
         # If the current geometry is a Polygon, add its exterior and interior rings to the queue
         elif isinstance(current, Polygon):
@@ -140,11 +142,11 @@ def get_polygon_top_or_bottom(polygon: Polygon, top_or_bottom: Literal["top", "b
     orient_polygon = orient(polygon, sign=-1)
 
     # Get the points of the polygon from the exterior - skip the last point (same as first point)
-    poly_points = [(p[0], p[1]) for p in list(orient_polygon.exterior.coords)][:-1]
+    poly_points = [(p[0], p[1]) for p in orient_polygon.exterior.coords][:-1]
 
     # Determine the outer x-coordinates
-    x_min = min([p[0] for p in poly_points])
-    x_max = max([p[0] for p in poly_points])
+    x_min = min(p[0] for p in poly_points)
+    x_max = max(p[0] for p in poly_points)
 
     # Get the points on the x_min line and sort them by y-coordinate
     x_min_points = sorted([p for p in poly_points if p[0] == x_min], key=lambda p: p[1])
@@ -193,23 +195,16 @@ def offset_line(line: LineString, offset: float, above_or_below: Literal["above"
     Returns: 
         A Shapely LineString"""
 
-    offset_line_strings = [
-        offset_curve(line, distance=offset)
-        for offset in [offset, -offset]
-    ]
-    offset_lines_coords = [
-        [(p[0], p[1]) for p in line.coords]
-        for line in offset_line_strings
-    ]
+    # Both offsets are determined in one call. The bounds are used to select the
+    # higher or lower line, so the coordinates don't have to be converted to Python.
+    offset_line_strings = offset_curve(line, distance=[offset, -offset])
+    bounds = shapely.bounds(offset_line_strings)  # (xmin, ymin, xmax, ymax)
 
     # Select the higher or lower line - depending on the above_or_below argument
     if above_or_below == "above":
-        offset_line_coords = max(offset_lines_coords, key=lambda lst: max(t[1] for t in lst))
+        offset_line = offset_line_strings[np.argmax(bounds[:, 3])]
     else:
-        offset_line_coords = min(offset_lines_coords, key=lambda lst: min(t[1] for t in lst))
-
-    # Make a LineString from the coordinates
-    offset_line = LineString(offset_line_coords)
+        offset_line = offset_line_strings[np.argmin(bounds[:, 1])]
 
     return offset_line
 
@@ -279,6 +274,72 @@ def simplify_line(
     return simplified_x, simplified_y
 
 
+def interpolation_arrays(
+        xp: list[float],
+        fp: list[float]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Converts the x and y coordinates of a line to numpy arrays with
+    increasing x-coordinates, for use with `interpolate_increasing`.
+
+    Args:
+        xp: The x-coordinates of the line. These must be monotonically
+          increasing or decreasing. Equal values are NOT allowed.
+        fp: The y-coordinates of the line
+
+    Returns:
+        A tuple of (x, y) arrays with increasing x-coordinates"""
+
+    xp_arr = np.asarray(xp, dtype=np.float64)
+    fp_arr = np.asarray(fp, dtype=np.float64)
+    diff = np.diff(xp_arr)
+
+    # Check if xp is monotonically increasing or decreasing
+    if not np.all(diff > 0) and not np.all(diff < 0):
+        raise ValueError(
+            "The x-coordinates of the line are not strictly increasing or decreasing "
+            "(equal values are not allowed).\n"
+            f"The x-coordinates are: {xp}\n"
+            f"The y-coordinates are: {fp}"
+        )
+
+    # Omdraaien is voldoende om de coördinaten oplopend te maken
+    if diff.size and diff[0] < 0:
+        xp_arr = xp_arr[::-1]
+        fp_arr = fp_arr[::-1]
+
+    return xp_arr, fp_arr
+
+
+def interpolate_increasing(
+        x: float | np.ndarray,
+        xp: np.ndarray,
+        fp: np.ndarray
+) -> np.ndarray:
+    """Performs linear interpolation on arrays as returned by `interpolation_arrays`.
+    Use this when interpolating repeatedly on the same line, so the coordinates
+    are converted and checked only once.
+
+    Args:
+        x: The x-coordinate(s) to interpolate the y-coordinate(s) for
+        xp: The strictly increasing x-coordinates of the line
+        fp: The y-coordinates of the line
+
+    Returns:
+        An array with the y-coordinate(s) of the interpolated point(s)"""
+
+    x_arr = np.asarray(x, dtype=np.float64)
+
+    # Check if x is within the range of xp
+    if x_arr.size and (x_arr.min() < xp[0] or x_arr.max() > xp[-1]):
+        outside = x_arr[(x_arr < xp[0]) | (x_arr > xp[-1])]
+        raise ValueError(
+            f"x-coordinate {outside[0]} is outside the range of x-coordinates [{xp[0]}, {xp[-1]}]"
+        )
+
+    # np.interp zoekt het segment met een binary search in C
+    return np.interp(x_arr, xp, fp)
+
+
 def linear_interpolation(
         x: float,
         xp: list[float],
@@ -296,26 +357,40 @@ def linear_interpolation(
     Returns:
         The y-coordinate of the interpolated point"""
 
-    # Check if x is within the range of xp
-    if x < min(xp) or x > max(xp):
-        raise ValueError(
-            f"x-coordinate {x} is outside the range of x-coordinates [{min(xp)}, {max(xp)}]"
-        )
+    # Snel pad voor een enkel lijnstuk, zonder numpy arrays
+    if len(xp) == 2 and xp[0] != xp[1]:
+        x0, x1 = xp
+        f0, f1 = fp
 
-    # Check if xp is monotonically increasing or decreasing
-    if not np.all(np.diff(xp) > 0) and not np.all(np.diff(xp) < 0):
-        raise ValueError(
-            f"The x-coordinates of the line are not monotonically increasing or decreasing"
-            "(equal values are allowed).\n"
-            f"The x-coordinates are: {xp}\n"
-            f"The y-coordinates are: {fp}"
-        )
+        if not min(x0, x1) <= x <= max(x0, x1):
+            raise ValueError(
+                f"x-coordinate {x} is outside the range of x-coordinates [{min(x0, x1)}, {max(x0, x1)}]"
+            )
+
+        return float(f0 + (x - x0) * (f1 - f0) / (x1 - x0))
+
+    return float(linear_interpolation_many(x, xp=xp, fp=fp))
+
+
+def linear_interpolation_many(
+        x: np.ndarray | list[float],
+        xp: list[float],
+        fp: list[float]
+) -> np.ndarray:
+    """Performs linear interpolation for multiple x-coordinates at once.
+    The same requirements as for `linear_interpolation` apply.
+
+    Args:
+        x: The x-coordinates to interpolate the y-coordinates for
+        xp: The x-coordinates of the line
+        fp: The y-coordinates of the line
+
+    Returns:
+        An array with the y-coordinates of the interpolated points"""
 
-    # Sort the x and y coordinates
-    xp, fp = zip(*sorted(zip(xp, fp), key=lambda p: p[0]))
+    xp_arr, fp_arr = interpolation_arrays(xp=xp, fp=fp)
 
-    # Perform linear interpolation
-    return np.interp(x, xp, fp)
+    return interpolate_increasing(x, xp=xp_arr, fp=fp_arr)
 
 
 def is_valid_polygon(polygon: Polygon, decimals: int = 3) -> bool:
@@ -331,8 +406,9 @@ def is_valid_polygon(polygon: Polygon, decimals: int = 3) -> bool:
     Returns:
         bool: True if the polygon is valid, False otherwise"""
 
-    points = [(round(x, decimals), round(y, decimals)) for x, y in polygon.exterior.coords]
-    rounded_polygon = Polygon(points)
+    # Round all coordinates at once, without converting them to Python tuples
+    coords = np.round(shapely.get_coordinates(polygon.exterior), decimals)
+    rounded_polygon = Polygon(coords)
     is_valid = rounded_polygon.is_valid and rounded_polygon.area != 0 and not rounded_polygon.is_empty
 
     return is_valid
@@ -1,5 +1,6 @@
 """Module with helper functions for lists"""
 
+from operator import attrgetter
 from typing import Any
 
 
@@ -25,6 +26,50 @@ def check_list_of_dicts_for_duplicate_values(dict_list: list[dict[Any, Any]], ke
         )
 
 
+def find_by_name(
+    cache: dict[Any, Any], items: list[Any], name: str, name_attr: str = "name"
+) -> Any | None:
+    """Returns the first item in `items` with the given name, or None if there is
+    no such item. By default the name is the `name` attribute of the items.
+
+    A name -> index lookup is kept in `cache` per name_attr, so a lookup takes
+    constant time instead of a scan of the list. The lookup is rebuilt when the
+    list is replaced or changes length, when the item at the cached index no longer
+    has the requested name (renamed, replaced or moved) and when the name is not
+    found. An earlier item that is renamed to the name of a later item is not
+    detected; the later item is then still returned.
+
+    Args:
+        cache: the cache of the collection holding the list (see ModelCache)
+        items: list of items
+        name: name of the item to find
+        name_attr: Optional. The attribute holding the name, for items that are named
+          by another attribute (e.g. "gl_soil.name"). Defaults to "name".
+
+    Returns:
+        The first item with the given name or None"""
+
+    get_name = attrgetter(name_attr)
+    cached = cache.get(("by_name", name_attr))
+
+    if cached is not None and cached[0] is items and cached[1] == len(items):
+        index = cached[2].get(name)
+
+        if index is not None and get_name(items[index]) == name:
+            return items[index]
+
+    # (Opnieuw) opbouwen. Net als bij een lineaire zoekactie wint het eerste item met de naam.
+    index_by_name: dict[Any, int] = {}
+
+    for i, item in enumerate(items):
+        index_by_name.setdefault(get_name(item), i)
+
+    cache[("by_name", name_attr)] = (items, len(items), index_by_name)
+    index = index_by_name.get(name)
+
+    return None if index is None else items[index]
+
+
 def unique_in_order(lst: list) -> list:
     """Returns a list of unique items in the order they appear in the list
 
@@ -56,9 +101,18 @@ def get_list_item_indices(li: list[str], di: dict[str, str]) -> dict[str, int]:
     {'first': 2, 'second': 1, 'third': 0}
 
     """
+    # Eenmalig de posities in de list bepalen. Net als list.index wordt de eerste positie gebruikt.
+    positions: dict[str, int] = {}
+
+    for i, item in enumerate(li):
+        positions.setdefault(item, i)
+
     indices: dict[str, int] = {}
 
-    for key in di:
-        indices[key] = li.index(di[key])
+    for key, value in di.items():
+        if value not in positions:
+            raise ValueError(f"'{value}' is not in list")
+
+        indices[key] = positions[value]
 
     return indices
@@ -0,0 +1,11 @@
+"""Tests for BOLuS
+
+The tests are independent of each other and can be run in parallel with
+pytest-xdist (part of the dev dependency group):
+
+    pytest -n auto --dist loadscope
+
+Several test classes load fixtures or parse D-Stability files once in
+setUpClass. With --dist loadscope all tests of a class run on the same
+worker, so this work is not repeated on every worker.
+"""
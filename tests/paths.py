@@ -0,0 +1,23 @@
+"""Paths to the test fixtures, shared by the test modules"""
+
+import os
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(TESTS_DIR, "fixtures")
+DSTABILITY_DIR = os.path.join(FIXTURE_DIR, "dstability")
+
+CHAR_POINT_JSON_PATH = os.path.join(FIXTURE_DIR, "char_point_example.json")
+CHAR_COLLECTION_JSON_PATH = os.path.join(
+    FIXTURE_DIR, "char_points_profile_collection_example.json"
+)
+SURF_COLLECTION_JSON_PATH = os.path.join(
+    FIXTURE_DIR, "surface_line_collection_example.json"
+)
+GRID_SETTINGS_SET_COLLECTION_JSON_PATH = os.path.join(
+    FIXTURE_DIR, "grid_settings_set_collection_example.json"
+)
+INPUT_STRUCTURE_JSON_PATH = os.path.join(FIXTURE_DIR, "input_structure_example.json")
+MODEL_JSON_PATH = os.path.join(FIXTURE_DIR, "model_example.json")
+SOIL_PROFILE_COLLECTION_JSON_PATH = os.path.join(
+    FIXTURE_DIR, "soil_profile_collection_example.json"
+)
@@ -1,6 +1,5 @@
 """Tests for the input reader functionality"""
 
-import os
 from unittest import TestCase
 
 from geolib.models.dstability.internal import OptionsType
@@ -19,9 +18,6 @@ from bolus.toolbox.calculation_settings import SlipPlaneModel, GridSettingsSetCo
     UpliftVanParticleSwarm
 from bolus.toolbox.model_creator import GeneralSettings, ModelConfig, StageConfig, ScenarioConfig, UserInputStructure
 
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(TEST_DIR)), "fixtures")
-
 
 class TestExcelInputReader(TestCase):
     """Tests for the ExcelInputReader class"""
@@ -347,34 +343,37 @@ class TestRawInputToUserInputStructure(TestCase):
         self.assertIsInstance(soils.soils[0], Soil)
         self.assertEqual(len(soils.soils), 1)
         soil = soils.soils[0]
-        self.assertEqual(soil.gl_soil.name, "Clay")
-        self.assertEqual(soil.gl_soil.soil_weight_parameters.unsaturated_weight, 16.0)
-        self.assertEqual(soil.gl_soil.soil_weight_parameters.saturated_weight, 18.0)
-        self.assertEqual(soil.gl_soil.shear_strength_model_above_phreatic_level,
+        gl = soil.gl_soil
+        mc = gl.mohr_coulomb_parameters
+        und = gl.undrained_parameters
+        self.assertEqual(gl.name, "Clay")
+        self.assertEqual(gl.soil_weight_parameters.unsaturated_weight, 16.0)
+        self.assertEqual(gl.soil_weight_parameters.saturated_weight, 18.0)
+        self.assertEqual(gl.shear_strength_model_above_phreatic_level,
                          ShearStrengthModelTypePhreaticLevel.MOHR_COULOMB)
-        self.assertEqual(soil.gl_soil.shear_strength_model_below_phreatic_level,
+        self.assertEqual(gl.shear_strength_model_below_phreatic_level,
                          ShearStrengthModelTypePhreaticLevel.MOHR_COULOMB)
-        self.assertTrue(soil.gl_soil.is_probabilistic)
-        self.assertFalse(soil.gl_soil.mohr_coulomb_parameters.cohesion.is_probabilistic)  # std set to 0, so should be deterministic
-        self.assertEqual(soil.gl_soil.mohr_coulomb_parameters.cohesion.mean, 5.0)
-        self.assertEqual(soil.gl_soil.mohr_coulomb_parameters.cohesion.standard_deviation, 0.0)
-        self.assertTrue(soil.gl_soil.mohr_coulomb_parameters.friction_angle.is_probabilistic) # std has value, so should be probabilistic
-        self.assertEqual(soil.gl_soil.mohr_coulomb_parameters.friction_angle.mean, 30.0)
-        self.assertEqual(soil.gl_soil.mohr_coulomb_parameters.friction_angle.standard_deviation, 1.0)
-        self.assertFalse(soil.gl_soil.mohr_coulomb_parameters.dilatancy_angle.is_probabilistic)
-        self.assertEqual(soil.gl_soil.mohr_coulomb_parameters.dilatancy_angle.mean, 1.0)
-        self.assertEqual(soil.gl_soil.mohr_coulomb_parameters.dilatancy_angle.standard_deviation, 0.0)
-        self.assertEqual(soil.gl_soil.undrained_parameters.shear_strength_ratio.mean, 0.25)
-        self.assertEqual(soil.gl_soil.undrained_parameters.shear_strength_ratio.standard_deviation, 0.02)
-        self.assertTrue(soil.gl_soil.undrained_parameters.shear_strength_ratio.is_probabilistic)
-        self.assertFalse(soil.gl_soil.undrained_parameters.strength_increase_exponent.is_probabilistic)
-        self.assertEqual(soil.gl_soil.undrained_parameters.strength_increase_exponent.mean, 0.8)
-        self.assertEqual(soil.gl_soil.undrained_parameters.strength_increase_exponent.standard_deviation, 0.0)
+        self.assertTrue(gl.is_probabilistic)
+        self.assertFalse(mc.cohesion.is_probabilistic)  # std set to 0, so should be deterministic
+        self.assertEqual(mc.cohesion.mean, 5.0)
+        self.assertEqual(mc.cohesion.standard_deviation, 0.0)
+        self.assertTrue(mc.friction_angle.is_probabilistic) # std has value, so should be probabilistic
+        self.assertEqual(mc.friction_angle.mean, 30.0)
+        self.assertEqual(mc.friction_angle.standard_deviation, 1.0)
+        self.assertFalse(mc.dilatancy_angle.is_probabilistic)
+        self.assertEqual(mc.dilatancy_angle.mean, 1.0)
+        self.assertEqual(mc.dilatancy_angle.standard_deviation, 0.0)
+        self.assertEqual(und.shear_strength_ratio.mean, 0.25)
+        self.assertEqual(und.shear_strength_ratio.standard_deviation, 0.02)
+        self.assertTrue(und.shear_strength_ratio.is_probabilistic)
+        self.assertFalse(und.strength_increase_exponent.is_probabilistic)
+        self.assertEqual(und.strength_increase_exponent.mean, 0.8)
+        self.assertEqual(und.strength_increase_exponent.standard_deviation, 0.0)
         self.assertTrue(soil.probabilistic_pop)
         self.assertEqual(soil.pop_mean, 10.0)
         self.assertEqual(soil.pop_std, 1.0)
-        self.assertFalse(soil.gl_soil.mohr_coulomb_parameters.cohesion_and_friction_angle_correlated)
-        self.assertFalse(soil.gl_soil.undrained_parameters.shear_strength_ratio_and_shear_strength_exponent_correlated)
+        self.assertFalse(mc.cohesion_and_friction_angle_correlated)
+        self.assertFalse(und.shear_strength_ratio_and_shear_strength_exponent_correlated)
         self.assertEqual(soil.consolidation_traffic_load, 50.)
 
     def test_convert_soil_collection_missing_keys(self):
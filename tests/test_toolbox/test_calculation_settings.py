@@ -1,5 +1,4 @@
 import json
-import os
 from unittest import TestCase
 
 from geolib.models.dstability.analysis import (
@@ -7,24 +6,34 @@ from geolib.models.dstability.analysis import (
     DStabilityUpliftVanParticleSwarmAnalysisMethod)
 from geolib.models.dstability.internal import OptionsType
 
-from bolus.toolbox.calculation_settings import (BishopBruteForce,
+from bolus.toolbox.calculation_settings import (GRID_SETTINGS_BY_SLIP_PLANE_MODEL,
+                                          BishopBruteForce,
                                           GridSettingsSet,
                                           GridSettingsSetCollection,
                                           SlipPlaneModel,
                                           UpliftVanParticleSwarm)
 from bolus.toolbox.geometry import (CharPoint, CharPointsProfile,
                      CharPointType, Side)
-
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-GRID_SETTINGS_SET_COLLECTION_JSON_PATH = os.path.join(
-    FIXTURE_DIR, "grid_settings_set_collection_example.json"
+from tests.paths import GRID_SETTINGS_SET_COLLECTION_JSON_PATH
+
+
+# Shared by the tests below, which only read the profile
+CHAR_POINTS_PROFILE = CharPointsProfile(
+    name="Profile 1",
+    points=[
+        CharPoint(x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_LAND_SIDE),
+        CharPoint(x=0, y=0, z=0, l=5, type=CharPointType.DIKE_TOE_LAND_SIDE),
+        CharPoint(x=0, y=0, z=4, l=10, type=CharPointType.DIKE_CREST_LAND_SIDE),
+        CharPoint(x=0, y=0, z=4, l=20, type=CharPointType.DIKE_CREST_WATER_SIDE),
+        CharPoint(x=0, y=0, z=0, l=30, type=CharPointType.SURFACE_LEVEL_WATER_SIDE),
+    ],
 )
 
 
 class TestGridSettings(TestCase):
-    def setUp(self):
-        self.bishop_bruteforce = BishopBruteForce(
+    @classmethod
+    def setUpClass(cls):
+        cls.bishop_bruteforce = BishopBruteForce(
             grid_setting_name="Bishop",
             slip_plane_model=SlipPlaneModel.BISHOP_BRUTE_FORCE,
             grid_position=CharPointType.DIKE_CREST_LAND_SIDE,
@@ -52,7 +61,7 @@ class TestGridSettings(TestCase):
             zone_b_width=None
         )
 
-        self.uplift_van_particle_swarm = UpliftVanParticleSwarm(
+        cls.uplift_van_particle_swarm = UpliftVanParticleSwarm(
             grid_setting_name="Uplift",
             slip_plane_model=SlipPlaneModel.UPLIFT_VAN_PARTICLE_SWARM,
             grid_1_position=CharPointType.DIKE_CREST_WATER_SIDE,
@@ -84,22 +93,7 @@ class TestGridSettings(TestCase):
             zone_b_width=None
         )
 
-        self.char_points_profile = CharPointsProfile(
-            name="Profile 1",
-            points=[
-                CharPoint(
-                    x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_LAND_SIDE
-                ),
-                CharPoint(x=0, y=0, z=0, l=5, type=CharPointType.DIKE_TOE_LAND_SIDE),
-                CharPoint(x=0, y=0, z=4, l=10, type=CharPointType.DIKE_CREST_LAND_SIDE),
-                CharPoint(
-                    x=0, y=0, z=4, l=20, type=CharPointType.DIKE_CREST_WATER_SIDE
-                ),
-                CharPoint(
-                    x=0, y=0, z=0, l=30, type=CharPointType.SURFACE_LEVEL_WATER_SIDE
-                ),
-            ],
-        )
+        cls.char_points_profile = CHAR_POINTS_PROFILE
 
     def test_slip_plane_constraints_to_geolib(self):
         constraints = self.bishop_bruteforce.slip_plane_constraints_to_geolib(
@@ -109,8 +103,9 @@ class TestGridSettings(TestCase):
 
 
 class TestUpliftVanParticleSwarm(TestCase):
-    def setUp(self):
-        self.uplift_van_particle_swarm = UpliftVanParticleSwarm(
+    @classmethod
+    def setUpClass(cls):
+        cls.uplift_van_particle_swarm = UpliftVanParticleSwarm(
             grid_setting_name="test",
             slip_plane_model=SlipPlaneModel.UPLIFT_VAN_PARTICLE_SWARM,
             apply_minimum_slip_plane_dimensions=True,
@@ -142,22 +137,7 @@ class TestUpliftVanParticleSwarm(TestCase):
             search_mode=OptionsType.THOROUGH,
         )
 
-        self.char_points_profile = CharPointsProfile(
-            name="Profile 1",
-            points=[
-                CharPoint(
-                    x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_LAND_SIDE
-                ),
-                CharPoint(x=0, y=0, z=0, l=5, type=CharPointType.DIKE_TOE_LAND_SIDE),
-                CharPoint(x=0, y=0, z=4, l=10, type=CharPointType.DIKE_CREST_LAND_SIDE),
-                CharPoint(
-                    x=0, y=0, z=4, l=20, type=CharPointType.DIKE_CREST_WATER_SIDE
-                ),
-                CharPoint(
-                    x=0, y=0, z=0, l=30, type=CharPointType.SURFACE_LEVEL_WATER_SIDE
-                ),
-            ],
-        )
+        cls.char_points_profile = CHAR_POINTS_PROFILE
 
     def test_to_geolib(self):
         uv_method = self.uplift_van_particle_swarm.to_geolib(self.char_points_profile)
@@ -192,8 +172,9 @@ class TestUpliftVanParticleSwarm(TestCase):
 
 
 class TestBishopBruteForce(TestCase):
-    def setUp(self):
-        self.bishop_brute_force = BishopBruteForce(
+    @classmethod
+    def setUpClass(cls):
+        cls.bishop_brute_force = BishopBruteForce(
             grid_setting_name="test",
             slip_plane_model=SlipPlaneModel.BISHOP_BRUTE_FORCE,
             apply_minimum_slip_plane_dimensions=True,
@@ -221,22 +202,7 @@ class TestBishopBruteForce(TestCase):
             move_grid=True,
         )
 
-        self.char_points_profile = CharPointsProfile(
-            name="Profile 1",
-            points=[
-                CharPoint(
-                    x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_LAND_SIDE
-                ),
-                CharPoint(x=0, y=0, z=0, l=5, type=CharPointType.DIKE_TOE_LAND_SIDE),
-                CharPoint(x=0, y=0, z=4, l=10, type=CharPointType.DIKE_CREST_LAND_SIDE),
-                CharPoint(
-                    x=0, y=0, z=4, l=20, type=CharPointType.DIKE_CREST_WATER_SIDE
-                ),
-                CharPoint(
-                    x=0, y=0, z=0, l=30, type=CharPointType.SURFACE_LEVEL_WATER_SIDE
-                ),
-            ],
-        )
+        cls.char_points_profile = CHAR_POINTS_PROFILE
 
     def test_to_geolib(self):
         search_grid = self.bishop_brute_force.to_geolib(self.char_points_profile)
@@ -253,9 +219,25 @@ class TestBishopBruteForce(TestCase):
         self.assertAlmostEqual(search_grid.space_tangent_lines, 1 / 2)
 
 
+class TestGridSettingsBySlipPlaneModel(TestCase):
+    def test_all_slip_plane_models_registered(self):
+        self.assertEqual(
+            set(GRID_SETTINGS_BY_SLIP_PLANE_MODEL), set(SlipPlaneModel)
+        )
+        self.assertIs(
+            GRID_SETTINGS_BY_SLIP_PLANE_MODEL[SlipPlaneModel.BISHOP_BRUTE_FORCE],
+            BishopBruteForce,
+        )
+        self.assertIs(
+            GRID_SETTINGS_BY_SLIP_PLANE_MODEL[SlipPlaneModel.UPLIFT_VAN_PARTICLE_SWARM],
+            UpliftVanParticleSwarm,
+        )
+
+
 class TestGridSettingsSets(TestCase):
-    def setUp(self):
-        self.grid_settings = [
+    @classmethod
+    def setUpClass(cls):
+        cls.grid_settings_template = [
             BishopBruteForce(
                 grid_setting_name="Bishop",
                 slip_plane_model=SlipPlaneModel.BISHOP_BRUTE_FORCE,
@@ -316,6 +298,12 @@ class TestGridSettingsSets(TestCase):
             ),
         ]
 
+    def setUp(self):
+        # Shallow copies are sufficient, the tests only reassign attributes
+        self.grid_settings = [
+            grid_setting.model_copy() for grid_setting in self.grid_settings_template
+        ]
+
     def test_init(self):
         grid_settings_set = GridSettingsSet(
             name="test", grid_settings=self.grid_settings
@@ -338,21 +326,15 @@ class TestGridSettingsSets(TestCase):
 
 
 class TestGridSettingsSetCollection(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         with open(GRID_SETTINGS_SET_COLLECTION_JSON_PATH) as f:
-            self.grid_settings_set_collection_dict = json.load(f)
-            self.grid_settings_set_collection = (
-                GridSettingsSetCollection.model_validate(
-                    self.grid_settings_set_collection_dict
-                )
-            )
+            cls.grid_settings_set_collection_dict = json.load(f)
 
-        grid_settings_set_list = self.grid_settings_set_collection_dict[
-            "grid_settings_sets"
-        ]
-        self.input_dict = {
-            di["name"]: di["grid_settings"] for di in grid_settings_set_list
-        }
+    def setUp(self):
+        self.grid_settings_set_collection = GridSettingsSetCollection.model_validate(
+            self.grid_settings_set_collection_dict
+        )
 
     def test_get_by_name(self):
         collection_from_json = GridSettingsSetCollection.model_validate(
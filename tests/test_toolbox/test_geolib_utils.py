@@ -8,10 +8,7 @@ from geolib.models.dstability.internal import CalculationSettings
 from bolus.toolbox.geolib_utils import (
     get_all_calculations, get_by_id, get_calculation_settings_by_result_id,
     get_stage_by_indices)
-
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-DSTABILITY_DIR = os.path.join(FIXTURE_DIR, "dstability")
+from tests.paths import DSTABILITY_DIR
 
 
 class TestDmGetter(TestCase):
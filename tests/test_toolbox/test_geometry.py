@@ -1,24 +1,14 @@
 import json
 import os
-from copy import deepcopy
 from unittest import TestCase
 
-from bolus.excel_tool.input_reader import RawInputToUserInputStructure
 from bolus.toolbox.geometry import (CharPoint, CharPointsProfile,
                      CharPointsProfileCollection,
-                     CharPointType, Point, SurfaceLine,
+                     CharPointType, Geometry, Point, Side, SurfaceLine,
                      SurfaceLineCollection,
                      create_geometries)
-
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-CHAR_POINT_JSON_PATH = os.path.join(FIXTURE_DIR, "char_point_example.json")
-CHAR_COLLECTION_JSON_PATH = os.path.join(
-    FIXTURE_DIR, "char_points_profile_collection_example.json"
-)
-SURF_COLLECTION_JSON_PATH = os.path.join(
-    FIXTURE_DIR, "surface_line_collection_example.json"
-)
+from tests.paths import (CHAR_COLLECTION_JSON_PATH, CHAR_POINT_JSON_PATH,
+                         FIXTURE_DIR, SURF_COLLECTION_JSON_PATH)
 
 
 class TestPoint(TestCase):
@@ -91,17 +81,21 @@ class TestProfileLine(TestCase):
         with self.assertRaises(ValueError):
             surface_line.check_l_coordinates_present()
 
-    def test_set_l_coordinates_first_is_left_point(self):
+    def test_set_l_coordinates(self):
+        """The first or the last point can be the left point"""
         surface_line = SurfaceLine(name="test", points=self.points)
-        surface_line.set_l_coordinates(left_point=surface_line.points[0])
-        actual_l = [p.l for p in surface_line.points]
-        self.assertEqual(actual_l, self.expected_l_first_is_left_point)
+        cases = [
+            ("first_is_left_point", 0, self.expected_l_first_is_left_point),
+            ("last_is_left_point", -1, self.expected_l_last_is_left_point),
+        ]
 
-    def test_set_l_coordinates_last_is_left_point(self):
-        surface_line = SurfaceLine(name="test", points=self.points)
-        surface_line.set_l_coordinates(left_point=surface_line.points[-1])
-        actual_l = [p.l for p in surface_line.points]
-        self.assertEqual(actual_l, self.expected_l_last_is_left_point)
+        for case, left_point_index, expected_l in cases:
+            with self.subTest(case=case):
+                surface_line.set_l_coordinates(
+                    left_point=surface_line.points[left_point_index]
+                )
+                actual_l = [p.l for p in surface_line.points]
+                self.assertEqual(actual_l, expected_l)
 
     def test_set_coordinates_invalid_left_point(self):
         surface_line = SurfaceLine(name="test", points=self.points)
@@ -166,9 +160,10 @@ class TestProfileLine(TestCase):
             surface_line.get_z_at_l(100)
 
 class TestCharPointsProfile(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         with open(CHAR_POINT_JSON_PATH) as f:
-            self.char_points_dict = json.load(f)
+            cls.char_points_dict = json.load(f)
 
     def test_from_dict(self):
         char_points_profile = CharPointsProfile.from_dict(
@@ -194,6 +189,23 @@ class TestCharPointsProfile(TestCase):
         with self.assertRaises(ValueError):
             char_points_profile.get_point_by_type(CharPointType.BERM_CREST_WATER_SIDE)
 
+    def test_get_point_by_type_after_change(self):
+        char_points_profile = CharPointsProfile.from_dict(
+            name="test", char_points_dict=self.char_points_dict
+        )
+        char_points_profile.get_point_by_type(CharPointType.DIKE_CREST_WATER_SIDE)
+
+        # Points added or replaced after a lookup are found
+        berm_point = CharPoint(x=-10, y=0, z=4, type=CharPointType.BERM_CREST_WATER_SIDE)
+        char_points_profile.points.append(berm_point)
+        self.assertIs(char_points_profile.get_point_by_type(CharPointType.BERM_CREST_WATER_SIDE), berm_point)
+
+        copied_profile = char_points_profile.model_copy(deep=True)
+        copied_profile.points = copied_profile.points[:-1]
+
+        with self.assertRaises(ValueError):
+            copied_profile.get_point_by_type(CharPointType.BERM_CREST_WATER_SIDE)
+
     def test_to_dict(self):
         char_points_profile = CharPointsProfile.from_dict(
             name="test", char_points_dict=self.char_points_dict
@@ -223,9 +235,6 @@ class TestSurfaceLine(TestCase):
 
 class TestSurfaceLineCollection(TestCase):
     def setUp(self):
-        with open(SURF_COLLECTION_JSON_PATH) as f:
-            self.surface_line_collection_dict = json.load(f)
-
         self.surface_line_collection = SurfaceLineCollection(
             surface_lines=[
                 SurfaceLine(
@@ -265,9 +274,6 @@ class TestSurfaceLineCollection(TestCase):
 
 class TestCharPointsProfileCollection(TestCase):
     def setUp(self):
-        with open(CHAR_COLLECTION_JSON_PATH) as f:
-            self.char_collection_dict = json.load(f)
-
         self.char_collection = CharPointsProfileCollection(
             char_points_profiles=[
                 CharPointsProfile(
@@ -328,18 +334,27 @@ class TestCharPointsProfileCollection(TestCase):
 
 
 class TestGeometry(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         with open(CHAR_COLLECTION_JSON_PATH) as f:
-            char_collection_dict = json.load(f)
+            cls.char_collection_dict = json.load(f)
 
         with open(SURF_COLLECTION_JSON_PATH) as f:
-            surface_line_collection_dict = json.load(f)
+            cls.surface_line_collection_dict = json.load(f)
 
-        self.surface_line_collection = RawInputToUserInputStructure.convert_surface_lines(
-            surface_line_collection_dict
+    def setUp(self):
+        # The collections are created per test, since tests may modify them
+        self.surface_line_collection = SurfaceLineCollection(
+            surface_lines=[
+                SurfaceLine.from_list(name=name, point_list=point_list)
+                for name, point_list in self.surface_line_collection_dict.items()
+            ]
         )
-        self.char_line_collection = RawInputToUserInputStructure.convert_char_points(
-            char_collection_dict
+        self.char_line_collection = CharPointsProfileCollection(
+            char_points_profiles=[
+                CharPointsProfile.from_dict(name=name, char_points_dict=char_points)
+                for name, char_points in self.char_collection_dict.items()
+            ]
         )
 
     def test_create_geometries(self):
@@ -363,4 +378,45 @@ class TestGeometry(TestCase):
                 char_type_left_point=CharPointType.SURFACE_LEVEL_LAND_SIDE,
             )
 
-    # TODO test get_intersection
+    def test_get_intersection(self):
+        r"""
+        The surface line looks like this (l-axis positive towards the land side):
+        2          ______
+        1     /   /      \
+        0 ___/\__/        \___
+          0  2 3 4 5  7   9  11
+        """
+        points = [
+            Point(x=l, y=0, z=z, l=l)
+            for l, z in [(0, 0), (2, 0), (3, 1), (4, 0), (5, 2), (7, 2), (9, 0), (11, 0)]
+        ]
+        geometry = Geometry(
+            name="test",
+            surface_line=SurfaceLine(name="test", points=points),
+            char_point_profile=CharPointsProfile(
+                name="test",
+                points=[
+                    CharPoint(x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_WATER_SIDE),
+                    CharPoint(x=11, y=0, z=0, l=11, type=CharPointType.SURFACE_LEVEL_LAND_SIDE),
+                ],
+            ),
+        )
+
+        cases = [
+            (0.5, Side.LAND_SIDE, (2.5, 0.5)),  # Multiple crossings, the most water side one is returned
+            (0.5, Side.WATER_SIDE, (8.5, 0.5)),
+            (2, Side.LAND_SIDE, (5, 2)),  # Horizontal segment on the level
+            (2, Side.WATER_SIDE, (7, 2)),
+            (1, Side.LAND_SIDE, (3, 1)),  # Touching a vertex
+            (3, Side.LAND_SIDE, None),  # No intersection
+        ]
+
+        for level, direction, expected in cases:
+            with self.subTest(level=level, direction=direction):
+                result = geometry.get_intersection(level=level, search_direction=direction)
+
+                if expected is None:
+                    self.assertIsNone(result)
+                else:
+                    self.assertAlmostEqual(result[0], expected[0])
+                    self.assertAlmostEqual(result[1], expected[1])
@@ -1,34 +1,78 @@
  # from soil profile position
  # from subsoil collection
 
-import os
 from unittest import TestCase
 import json
 
+import pytest
+
 from bolus.toolbox.subsoil import SubsoilCollection, Subsoil, SubsoilInputType, SoilPolygon
 from bolus.toolbox.model_creator import UserInputStructure, input_to_models
-
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-INPUT_STRUCTURE_JSON_PATH = os.path.join(FIXTURE_DIR, "input_structure_example.json")
+from tests.paths import INPUT_STRUCTURE_JSON_PATH
 
 
 class TestModelCreator(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         with open(INPUT_STRUCTURE_JSON_PATH) as f:
-            self.input_structure = UserInputStructure.model_validate(json.load(f))
+            cls.input_structure_dict = json.load(f)
+
+        # Shared by the tests that do not modify the input structure
+        cls.input_structure = UserInputStructure.model_validate(cls.input_structure_dict)
 
+    @pytest.mark.slow
     def test_input_to_models(self):
         """Large integration test"""
-        input_to_models(self.input_structure)
+        models = input_to_models(self.input_structure)
+
+        # Stages with the same geometry, soil profile position and revetment
+        # get an equal subsoil, but not the same object
+        stages = models[0].scenarios[0].stages
+        self.assertEqual(stages[0].subsoil, stages[1].subsoil)
+        self.assertIsNot(stages[0].subsoil, stages[1].subsoil)
+        self.assertIsNot(stages[0].waternet, stages[1].waternet)
+
+    @pytest.mark.slow
+    def test_input_to_models_stages_independent(self):
+        """Changing the subsoil or waternet of one stage does not change other stages"""
+        models = input_to_models(self.input_structure)
+        stages = models[0].scenarios[0].stages
+        other_stages = [
+            stage
+            for model in models[1:]
+            for scenario in model.scenarios
+            for stage in scenario.stages
+        ] + stages[1:]
+        subsoils_before = [stage.subsoil.model_copy(deep=True) for stage in other_stages]
+        waternets_before = [
+            stage.waternet.model_copy(deep=True) if stage.waternet is not None else None
+            for stage in other_stages
+        ]
 
+        stages[0].subsoil.soil_polygons.append(
+            SoilPolygon(soil_type="Klei siltig", points=[(0, 0), (1, 0), (1, 1), (0, 1)])
+        )
+        stages[0].subsoil.soil_polygons[0].points[0] = (-999.0, -999.0)
+        stages[0].waternet.head_lines[0].z[0] = -999.0
+
+        for stage, subsoil, waternet in zip(other_stages, subsoils_before, waternets_before):
+            self.assertEqual(stage.subsoil, subsoil)
+            self.assertEqual(stage.waternet, waternet)
+
+    @pytest.mark.slow
     def test_input_to_models_with_subsoil(self):
-        self.input_structure.model_configs[0].scenarios[0].stages[0].subsoil_input_type = SubsoilInputType.FROM_SUBSOIL_COLLECTION
-        self.input_structure.model_configs[0].scenarios[0].stages[0].subsoil_name = "subsoil_1"
-        self.input_structure.subsoils = SubsoilCollection(
+        # Modifies the input, so validate a separate instance. This is
+        # faster than model_copy(deep=True) of the shared instance.
+        input_structure = UserInputStructure.model_validate(self.input_structure_dict)
+        input_structure.model_configs[0].scenarios[0].stages[0].subsoil_input_type = SubsoilInputType.FROM_SUBSOIL_COLLECTION
+        input_structure.model_configs[0].scenarios[0].stages[0].subsoil_name = "subsoil_1"
+        input_structure.subsoils = SubsoilCollection(
             subsoils=[
                 Subsoil(name="subsoil_1", soil_polygons=[SoilPolygon(soil_type="Klei siltig", points=[(0, 0), (1, 0), (1, 1), (0, 1)])])
             ]
         )
-        input_to_models(self.input_structure)
+        input_to_models(input_structure)
+
+        # The revetment is added to a copy, the subsoil in the input is not modified
+        self.assertEqual(len(input_structure.subsoils.subsoils[0].soil_polygons), 1)
 
@@ -1,4 +1,4 @@
-import os
+import pickle
 from unittest import TestCase
 
 from geolib.models import DStabilityModel
@@ -18,23 +18,44 @@ from bolus.toolbox.soils import Soil, SoilCollection
 from bolus.toolbox.state import StatePoint
 from bolus.toolbox.subsoil import SoilPolygon, Subsoil
 from bolus.toolbox.waternet import HeadLine, ReferenceLine, Waternet
+from tests.paths import MODEL_JSON_PATH
 
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-MODEL_JSON_PATH = os.path.join(FIXTURE_DIR, "model_example.json")
+# Unpickling a blank model is several times faster than constructing one
+BLANK_DM_PICKLE = pickle.dumps(DStabilityModel())
+
+
+def blank_d_stability_model() -> DStabilityModel:
+    """Returns a new, blank DStabilityModel"""
+    return pickle.loads(BLANK_DM_PICKLE)
+
+
+def klei_zand_soil_collection() -> SoilCollection:
+    """Returns a new SoilCollection with the soils Klei and Zand. GEOLib assigns
+    ids to the soils when they are added to a model, so every test gets its own."""
+    return SoilCollection(
+        soils=[
+            Soil(gl_soil=GLSoil(code="Klei"), pop_mean=20, probabilistic_pop=False),
+            Soil(gl_soil=GLSoil(code="Zand"), pop_mean=None, probabilistic_pop=False),
+        ]
+    )
+
+
+def klei_zand_subsoil() -> Subsoil:
+    """Returns a new Subsoil with a Klei polygon on top of a Zand polygon"""
+    return Subsoil(
+        soil_polygons=[
+            SoilPolygon(soil_type="Klei", points=[(0, 0), (0, 1), (1, 1), (1, 0)]),
+            SoilPolygon(soil_type="Zand", points=[(0, 0), (0, -1), (1, -1), (1, 0)]),
+        ]
+    )
 
 
 class TestModifierAddSoilCollection(TestCase):
     def setUp(self):
-        self.soil_collection = SoilCollection(
-            soils=[
-                Soil(gl_soil=GLSoil(code="Klei"), pop_mean=20, probabilistic_pop=False),
-                Soil(gl_soil=GLSoil(code="Zand"), pop_mean=None, probabilistic_pop=False),
-            ]
-        )
+        self.soil_collection = klei_zand_soil_collection()
 
     def test_add_soil_collection(self):
-        dm = DStabilityModel()
+        dm = blank_d_stability_model()
         dm.datastructure.soils = GLSoilCollection(Soils=[])  # Remove default soils
         dm = add_soil_collection(self.soil_collection, dm)
         codes = [soil.Code for soil in dm.soils.Soils]
@@ -64,7 +85,7 @@ class TestModifierSetSubsoil(TestCase):
         # Setup test
         scenario_index = 0
         stage_index = 0
-        dm = DStabilityModel()
+        dm = blank_d_stability_model()
         add_soil_collection(self.soil_collection, dm)
 
         dm = set_subsoil(
@@ -85,25 +106,13 @@ class TestModifierSetSubsoil(TestCase):
 
 class TestModifierAddStatePoints(TestCase):
     def setUp(self):
-        self.soil_collection = SoilCollection(
-            soils=[
-                Soil(gl_soil=GLSoil(code="Klei"), pop_mean=20, probabilistic_pop=False),
-                Soil(gl_soil=GLSoil(code="Zand"), pop_mean=None, probabilistic_pop=False),
-            ]
-        )
-        self.subsoil = Subsoil(
-            soil_polygons=[
-                SoilPolygon(soil_type="Klei", points=[(0, 0), (0, 1), (1, 1), (1, 0)]),
-                SoilPolygon(
-                    soil_type="Zand", points=[(0, 0), (0, -1), (1, -1), (1, 0)]
-                ),
-            ]
-        )
+        self.soil_collection = klei_zand_soil_collection()
+        self.subsoil = klei_zand_subsoil()
 
     def test_add_state_points(self):
         # Setup test
         state_points = [StatePoint(x=0.5, z=0.5, pop_mean=20, probabilistic_pop=False)]
-        dm = DStabilityModel()
+        dm = blank_d_stability_model()
         add_soil_collection(self.soil_collection, dm)
         set_subsoil(subsoil=self.subsoil, dm=dm, scenario_index=0, stage_index=0)
         scenario_index = 0
@@ -118,7 +127,8 @@ class TestModifierAddStatePoints(TestCase):
 
 
 class TestModifierAddUniformLoad(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         char_points_outward_positive = [
             CharPoint(x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_LAND_SIDE),
             CharPoint(x=0, y=0, z=4, l=10, type=CharPointType.DIKE_CREST_LAND_SIDE),
@@ -131,14 +141,14 @@ class TestModifierAddUniformLoad(TestCase):
             CharPoint(x=0, y=0, z=4, l=10, type=CharPointType.DIKE_CREST_WATER_SIDE),
             CharPoint(x=0, y=0, z=0, l=0, type=CharPointType.SURFACE_LEVEL_WATER_SIDE),
         ]
-        self.char_points_profile_outward_positive = CharPointsProfile(
+        cls.char_points_profile_outward_positive = CharPointsProfile(
             name="test", points=char_points_outward_positive
         )
-        self.char_points_profile_inward_positive = CharPointsProfile(
+        cls.char_points_profile_inward_positive = CharPointsProfile(
             name="test", points=char_points_inward_positive
         )
 
-        self.soil_collection = SoilCollection(
+        cls.soil_collection = SoilCollection(
             soils=[
                 Soil(
                     gl_soil=GLSoil(name="Klei", code="Klei"),
@@ -150,7 +160,7 @@ class TestModifierAddUniformLoad(TestCase):
                 ),
             ]
         )
-        self.subsoil = Subsoil(
+        cls.subsoil = Subsoil(
             soil_polygons=[
                 SoilPolygon(
                     soil_type="Klei", points=[(0, 0), (10, 4), (20, 4), (30, 0)]
@@ -161,182 +171,99 @@ class TestModifierAddUniformLoad(TestCase):
             ]
         )
 
-        dm = DStabilityModel()
-        dm = add_soil_collection(self.soil_collection, dm)
-        self.dm = set_subsoil(
-            subsoil=self.subsoil, dm=dm, scenario_index=0, stage_index=0
+        dm = blank_d_stability_model()
+        dm = add_soil_collection(cls.soil_collection, dm)
+        cls.base_dm = set_subsoil(
+            subsoil=cls.subsoil, dm=dm, scenario_index=0, stage_index=0
         )
 
-    def test_outward_positive_load_direction_outward(self):
+    def test_add_uniform_load(self):
         """
-        inward                         outward
-                       x->
-                      /-------\
-                     /         \
-                    /           \
-        l         0   10     20  30
-        positive direction of l is outward -->
+        The load is placed at a characteristic point and extends in the
+        given direction, for both orientations of the l-axis:
 
-        x: position of load
-        """
-        # Setup test
-        load = Load(
-            name="test",
-            magnitude=10,
-            angle=20,
-            width=5,
-            position=CharPointType.DIKE_CREST_LAND_SIDE,
-            direction=Side.WATER_SIDE,
-        )
-        add_uniform_load(
-            load=load,
-            soil_collection=self.soil_collection,
-            char_point_profile=self.char_points_profile_outward_positive,
-            dm=self.dm,
-            scenario_index=0,
-            stage_index=0,
-        )
-
-        # Run test
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Magnitude, load.magnitude
-        )
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Spread, load.angle
-        )
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].Start, 10)
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].End, 15)
-
-        consolidations = [
-            cons.Degree
-            for cons in self.dm.datastructure.loads[0].UniformLoads[0].Consolidations
-        ]
-        self.assertEqual(consolidations, [50, 100])
-
-    def test_outward_positive_load_direction_inward(self):
-        """
         inward                         outward
-                            <-x
                       /-------\
                      /         \
                     /           \
         l         0   10     20  30
         positive direction of l is outward -->
 
-        x: position of load
-        """
-        # Setup test
-        load = Load(
-            name="test",
-            magnitude=10,
-            angle=20,
-            width=5,
-            position=CharPointType.DIKE_CREST_WATER_SIDE,
-            direction=Side.LAND_SIDE,
-        )
-        add_uniform_load(
-            load=load,
-            soil_collection=self.soil_collection,
-            char_point_profile=self.char_points_profile_outward_positive,
-            dm=self.dm,
-            scenario_index=0,
-            stage_index=0,
-        )
-
-        # Run test
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Magnitude, load.magnitude
-        )
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Spread, load.angle
-        )
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].Start, 15)
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].End, 20)
-
-    def test_inward_positive_load_direction_outward(self):
-        """
-        inward                         outward
-                       x->
-                      /-------\
-                     /         \
-                    /           \
         l         30  20     10  0
         <- positive direction of l is inward
-
-        x: position of load
         """
-        # Setup test
-        load = Load(
-            name="test",
-            magnitude=10,
-            angle=20,
-            width=5,
-            position=CharPointType.DIKE_CREST_LAND_SIDE,
-            direction=Side.WATER_SIDE,
-        )
-        add_uniform_load(
-            load=load,
-            soil_collection=self.soil_collection,
-            char_point_profile=self.char_points_profile_inward_positive,
-            dm=self.dm,
-            scenario_index=0,
-            stage_index=0,
-        )
-
-        # Run test
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Magnitude, load.magnitude
-        )
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Spread, load.angle
-        )
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].Start, 15)
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].End, 20)
+        cases = [
+            # (case, char points profile, position, direction, start, end)
+            (
+                "outward_positive_load_direction_outward",
+                self.char_points_profile_outward_positive,
+                CharPointType.DIKE_CREST_LAND_SIDE,
+                Side.WATER_SIDE,
+                10,
+                15,
+            ),
+            (
+                "outward_positive_load_direction_inward",
+                self.char_points_profile_outward_positive,
+                CharPointType.DIKE_CREST_WATER_SIDE,
+                Side.LAND_SIDE,
+                15,
+                20,
+            ),
+            (
+                "inward_positive_load_direction_outward",
+                self.char_points_profile_inward_positive,
+                CharPointType.DIKE_CREST_LAND_SIDE,
+                Side.WATER_SIDE,
+                15,
+                20,
+            ),
+            (
+                "inward_positive_load_direction_inward",
+                self.char_points_profile_inward_positive,
+                CharPointType.DIKE_CREST_WATER_SIDE,
+                Side.LAND_SIDE,
+                10,
+                15,
+            ),
+        ]
 
-    def test_inward_positive_load_direction_inward(self):
-        """
-        inward                         outward
-                            <-x
-                      /-------\
-                     /         \
-                    /           \
-        l         30  20     10  0
-        <- positive direction of l is inward
+        for case, char_points_profile, position, direction, start, end in cases:
+            with self.subTest(case=case):
+                # Each case adds a load, so each case gets its own copy of the model
+                dm = self.base_dm.model_copy(deep=True)
+                load = Load(
+                    name="test",
+                    magnitude=10,
+                    angle=20,
+                    width=5,
+                    position=position,
+                    direction=direction,
+                )
+                add_uniform_load(
+                    load=load,
+                    soil_collection=self.soil_collection,
+                    char_point_profile=char_points_profile,
+                    dm=dm,
+                    scenario_index=0,
+                    stage_index=0,
+                )
 
-        x: position of load
-        """
-        # Setup test
-        load = Load(
-            name="test",
-            magnitude=10,
-            angle=20,
-            width=5,
-            position=CharPointType.DIKE_CREST_WATER_SIDE,
-            direction=Side.LAND_SIDE,
-        )
-        add_uniform_load(
-            load=load,
-            soil_collection=self.soil_collection,
-            char_point_profile=self.char_points_profile_inward_positive,
-            dm=self.dm,
-            scenario_index=0,
-            stage_index=0,
-        )
+                uniform_load = dm.datastructure.loads[0].UniformLoads[0]
+                self.assertEqual(uniform_load.Magnitude, load.magnitude)
+                self.assertEqual(uniform_load.Spread, load.angle)
+                self.assertEqual(uniform_load.Start, start)
+                self.assertEqual(uniform_load.End, end)
 
-        # Run test
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Magnitude, load.magnitude
-        )
-        self.assertEqual(
-            self.dm.datastructure.loads[0].UniformLoads[0].Spread, load.angle
-        )
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].Start, 10)
-        self.assertEqual(self.dm.datastructure.loads[0].UniformLoads[0].End, 15)
+                consolidations = [cons.Degree for cons in uniform_load.Consolidations]
+                self.assertEqual(consolidations, [50, 100])
 
 
 class TestSetWaternet(TestCase):
-    def setUp(self):
-        self.waternet = Waternet(
+    @classmethod
+    def setUpClass(cls):
+        # Only read by set_waternet, so it is shared by the tests
+        cls.waternet = Waternet(
             calc_name="test",
             scenario_name="test",
             stage_name="test",
@@ -355,12 +282,15 @@ class TestSetWaternet(TestCase):
             ],
         )
 
-    def test_set_waternet(self):
-        dm = DStabilityModel()
-        dm = set_waternet(
-            waternet=self.waternet, dm=dm, scenario_index=0, stage_index=0
+        # The model with the waternet is shared. Setting a waternet a second
+        # time raises before the model is modified.
+        cls.dm = set_waternet(
+            waternet=cls.waternet, dm=blank_d_stability_model(), scenario_index=0, stage_index=0
         )
 
+    def test_set_waternet(self):
+        dm = self.dm
+
         added_waternet = dm.datastructure.waternets[0]
         head_lines = added_waternet.HeadLines
         ref_lines = added_waternet.ReferenceLines
@@ -374,19 +304,17 @@ class TestSetWaternet(TestCase):
         self.assertEqual([r.Z for r in ref_points], self.waternet.ref_lines[0].z)
 
     def test_set_waternet_already_present(self):
-        dm = DStabilityModel()
-        dm = set_waternet(
-            waternet=self.waternet, dm=dm, scenario_index=0, stage_index=0
-        )
-
         with self.assertRaises(ValueError):
-            set_waternet(waternet=self.waternet, dm=dm, scenario_index=0, stage_index=0)
+            set_waternet(
+                waternet=self.waternet, dm=self.dm, scenario_index=0, stage_index=0
+            )
 
 
 class TestCreateDStabilityModel(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         with open(MODEL_JSON_PATH, "r") as f:
-            self.model = Model.model_validate_json(f.read())
+            cls.model = Model.model_validate_json(f.read())
 
     def test_create_d_stability_model(self):
         """Simple integral test"""
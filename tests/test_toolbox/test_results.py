@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 
@@ -12,10 +13,7 @@ from geolib.models.dstability.internal import (BishopBruteForceResult,
 
 from bolus.toolbox.results import (DStabilityResultExporter,
                      ResultSummary, results_from_dir)
-
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-DSTABILITY_DIR = os.path.join(FIXTURE_DIR, "dstability")
+from tests.paths import DSTABILITY_DIR
 
 
 class TestResultSummary(TestCase):
@@ -107,12 +105,12 @@ class TestDStabilityResultExporter(TestCase):
         self.dm = DStabilityModel()
         self.dm.parse(Path(os.path.join(DSTABILITY_DIR, "test_2.stix")))
 
-        # Temporary file
-        self.temp_file = Path(os.path.join(DSTABILITY_DIR, "test_2_results.xlsx"))
+        # Temporary file. A directory per test, so tests can run in parallel
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = Path(self.temp_dir.name, "test_2_results.xlsx")
 
     def tearDown(self):
-        if self.temp_file.exists():
-            self.temp_file.unlink()
+        self.temp_dir.cleanup()
 
     def test_read_template(self):
         exporter = DStabilityResultExporter(dm_list=[self.dm])
@@ -146,11 +144,11 @@ class TestResultsFromDir(TestCase):
     """Tests the results_from_dir function"""
 
     def setUp(self):
-        self.temp_file = Path(os.path.join(DSTABILITY_DIR, "temp_results.xlsx"))
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = Path(self.temp_dir.name, "temp_results.xlsx")
 
     def tearDown(self):
-        if self.temp_file.exists():
-            self.temp_file.unlink()
+        self.temp_dir.cleanup()
 
     def test_results_from_dir(self):
         results_from_dir(directory=DSTABILITY_DIR, output_path=self.temp_file)
@@ -8,8 +8,10 @@ from bolus.toolbox.subsoil import SoilPolygon, Subsoil
 
 
 class TestState(TestCase):
-    def setUp(self):
-        self.subsoil = Subsoil(
+    @classmethod
+    def setUpClass(cls):
+        # Only read by create_state_points_from_subsoil
+        cls.subsoil = Subsoil(
             soil_polygons=[
                 SoilPolygon(soil_type="Klei", points=[(0, 0), (0, 1), (1, 1), (1, 0)]),
                 SoilPolygon(
@@ -14,13 +14,11 @@ from bolus.toolbox.geometry import Point, SurfaceLine
 from bolus.toolbox.subsoil import (SoilLayer, SoilPolygon, SoilProfile,
                      Subsoil,
                      subsoil_from_soil_profiles)
+from tests.paths import DSTABILITY_DIR, SOIL_PROFILE_COLLECTION_JSON_PATH
 
-TEST_DIR = os.path.dirname(os.path.abspath(__file__))
-FIXTURE_DIR = os.path.join(os.path.dirname(TEST_DIR), "fixtures")
-SOIL_PROFILE_COLLECTION_JSON_PATH = os.path.join(
-    FIXTURE_DIR, "soil_profile_collection_example.json"
-)
-DSTABILITY_DIR = os.path.join(FIXTURE_DIR, "dstability")
+# Shared by the tests, which only read it
+with open(SOIL_PROFILE_COLLECTION_JSON_PATH, "r") as f:
+    SOIL_PROFILE_COLLECTION_DICT = json.load(f)
 
 
 class TestSoilProfile(TestCase):
@@ -46,9 +44,9 @@ class TestSoilProfile(TestCase):
 
 
 class TestSoilProfileCollection(TestCase):
-    def setUp(self):
-        with open(SOIL_PROFILE_COLLECTION_JSON_PATH, "r") as f:
-            self.soil_profile_collection_dict = json.load(f)
+    @classmethod
+    def setUpClass(cls):
+        cls.soil_profile_collection_dict = SOIL_PROFILE_COLLECTION_DICT
 
 
 class TestSoilPolygon(TestCase):
@@ -76,6 +74,32 @@ class TestSoilPolygon(TestCase):
         self.assertIsInstance(shapely_polygon, Polygon)
         self.assertEqual(shapely_polygon, Polygon([(0, 0), (0, 2), (2, 2), (2, 0)]))
 
+    def test_to_shapely_cached(self):
+        shapely_polygon = self.soil_polygon.to_shapely()
+        self.assertIs(self.soil_polygon.to_shapely(), shapely_polygon)
+        self.assertEqual(self.soil_polygon, SoilPolygon(soil_type="test", points=[(0, 0), (0, 2), (2, 2), (2, 0)]))
+
+        # to_shapely_many uses and fills the same cache
+        self.assertIs(SoilPolygon.to_shapely_many([self.soil_polygon])[0], shapely_polygon)
+        other = SoilPolygon(soil_type="test", points=[(0, 0), (0, 1), (1, 1)])
+        self.assertIs(SoilPolygon.to_shapely_many([other])[0], other.to_shapely())
+
+        # Replacing or changing the points invalidates the cache
+        self.soil_polygon.points = [(0, 0), (0, 1), (1, 1), (1, 0)]
+        self.assertEqual(self.soil_polygon.to_shapely(), Polygon([(0, 0), (0, 1), (1, 1), (1, 0)]))
+
+        self.soil_polygon.points[1] = (0, 2)
+        self.assertEqual(self.soil_polygon.to_shapely(), Polygon([(0, 0), (0, 2), (1, 1), (1, 0)]))
+
+    def test_canonical_points(self):
+        rotated = SoilPolygon(soil_type="test", points=[(2, 2), (2, 0), (0, 0), (0, 2)])
+        reversed_ = SoilPolygon(soil_type="test", points=[(0, 2), (2, 2), (2, 0), (0, 0)][::-1])
+        other_order = SoilPolygon(soil_type="test", points=[(0, 0), (2, 2), (0, 2), (2, 0)])
+
+        self.assertEqual(rotated.canonical_points(), self.soil_polygon.canonical_points())
+        self.assertEqual(reversed_.canonical_points(), self.soil_polygon.canonical_points())
+        self.assertNotEqual(other_order.canonical_points(), self.soil_polygon.canonical_points())
+
     def test_from_shapely(self):
         soil_type = "test"
         soil_polygon = SoilPolygon.from_shapely(soil_type, self.shapely_polygon)
@@ -85,8 +109,22 @@ class TestSoilPolygon(TestCase):
             SoilPolygon(soil_type="test", points=[(0, 0), (0, 3), (3, 3), (3, 0)]),
         )
 
+    def test_to_shapely_many(self):
+        soil_polygons = [
+            self.soil_polygon,
+            SoilPolygon(soil_type="test2", points=[(2, 0), (2, 1), (3, 1), (3, 0), (2.5, -0.5)]),
+        ]
+        shapely_polygons = SoilPolygon.to_shapely_many(soil_polygons)
+        self.assertEqual(shapely_polygons, [sp.to_shapely() for sp in soil_polygons])
+
 
 class TestSubsoil(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The parsed model is only read, so it is shared by the tests
+        cls.dm = DStabilityModel()
+        cls.dm.parse(Path(os.path.join(DSTABILITY_DIR, "test_1.stix")))
+
     def setUp(self):
         """
         The subsoil looks like this:
@@ -103,86 +141,72 @@ class TestSubsoil(TestCase):
         )
 
     def test_from_geolib(self):
-        dm = DStabilityModel()
-        dm.parse(Path(os.path.join(DSTABILITY_DIR, "test_1.stix")))
-
         scenario_index = 0
         stage_index = 1
-        subsoil = Subsoil.from_geolib(dm, scenario_index, stage_index)
+        subsoil = Subsoil.from_geolib(self.dm, scenario_index, stage_index)
 
         self.assertIsInstance(subsoil, Subsoil)
         self.assertEqual(len(subsoil.soil_polygons), 14)
 
     def test_remove_soil_polygons(self):
-        remove_polygons = [
-            Polygon([(0.5, 0.5), (0.5, 1), (1.5, 1), (1.5, 0.5)]), # Polygon that intersects both layers
-        ]
-        self.subsoil.remove_polygons(remove_polygons)
-
-        expected_soil_polygons = [
-            SoilPolygon(soil_type="sand", points=[(0, 0), (0, 1), (0.5, 1), (0.5, 0.5), (1, 0.5), (1, 0)], is_aquifer=True),
-            SoilPolygon(soil_type="clay", points=[(1, 0), (1, 0.5), (1.5, 0.5), (1.5, 1), (2, 1), (2, 0)], is_aquifer=False),
-        ]
-
-        # Starting point could be different, so we take the set and check if each point is present
-        self.assertEqual(set(self.subsoil.soil_polygons[0].points), set(expected_soil_polygons[0].points))
-        self.assertEqual(set(self.subsoil.soil_polygons[1].points), set(expected_soil_polygons[1].points))
-
-        # Check if the is_aquifer attribute is correct
-        self.assertEqual(self.subsoil.soil_polygons[0].is_aquifer, expected_soil_polygons[0].is_aquifer)
-        self.assertEqual(self.subsoil.soil_polygons[1].is_aquifer, expected_soil_polygons[1].is_aquifer)
-
-        # Check if the soil type is correct
-        self.assertEqual(self.subsoil.soil_polygons[0].soil_type, expected_soil_polygons[0].soil_type)
-        self.assertEqual(self.subsoil.soil_polygons[1].soil_type, expected_soil_polygons[1].soil_type)
-
-    def test_remove_soil_polygons_multiple(self):
-        remove_polygons = [
-            Polygon([(0.5, 0.5), (0.5, 1), (1.5, 1), (1.5, 0.5)]),  # Polygon that intersects both layers
-            Polygon([(0, 0.5), (0, 1), (0.25, 1), (0.25, 0.5)]),  # Polygon that intersects only the left layer
-        ]
-        self.subsoil.remove_polygons(remove_polygons)
-
-        expected_soil_polygons = [
-            SoilPolygon(soil_type="sand", points=[(0, 0), (0, 0.5), (0.25, 0.5), (0.25, 1), (0.5, 1), (0.5, 0.5), (1, 0.5), (1, 0)], is_aquifer=True),
-            SoilPolygon(soil_type="clay", points=[(1, 0), (1, 0.5), (1.5, 0.5), (1.5, 1), (2, 1), (2, 0)], is_aquifer=False),
+        cases = [
+            {
+                "case": "single",
+                "remove_polygons": [
+                    Polygon([(0.5, 0.5), (0.5, 1), (1.5, 1), (1.5, 0.5)]),  # Polygon that intersects both layers
+                ],
+                "expected_points": [
+                    [(0, 0), (0, 1), (0.5, 1), (0.5, 0.5), (1, 0.5), (1, 0)],
+                    [(1, 0), (1, 0.5), (1.5, 0.5), (1.5, 1), (2, 1), (2, 0)],
+                ],
+            },
+            {
+                "case": "multiple",
+                "remove_polygons": [
+                    Polygon([(0.5, 0.5), (0.5, 1), (1.5, 1), (1.5, 0.5)]),  # Polygon that intersects both layers
+                    Polygon([(0, 0.5), (0, 1), (0.25, 1), (0.25, 0.5)]),  # Polygon that intersects only the left layer
+                ],
+                "expected_points": [
+                    [(0, 0), (0, 0.5), (0.25, 0.5), (0.25, 1), (0.5, 1), (0.5, 0.5), (1, 0.5), (1, 0)],
+                    [(1, 0), (1, 0.5), (1.5, 0.5), (1.5, 1), (2, 1), (2, 0)],
+                ],
+            },
+            {
+                # We expect the subsoil to not change
+                "case": "no_overlap",
+                "remove_polygons": [
+                    Polygon([(0, 0), (0, -1), (1, -1), (1, 0)]),
+                ],
+                "expected_points": [soil_polygon.points for soil_polygon in self.subsoil.soil_polygons],
+            },
         ]
 
-        # Starting point could be different, so we take the set and check if each point is present
-        self.assertEqual(set(self.subsoil.soil_polygons[0].points), set(expected_soil_polygons[0].points))
-        self.assertEqual(set(self.subsoil.soil_polygons[1].points), set(expected_soil_polygons[1].points))
-
-        # Check if the is_aquifer attribute is correct
-        self.assertEqual(self.subsoil.soil_polygons[0].is_aquifer, expected_soil_polygons[0].is_aquifer)
-        self.assertEqual(self.subsoil.soil_polygons[1].is_aquifer, expected_soil_polygons[1].is_aquifer)
-
-        # Check if the soil type is correct
-        self.assertEqual(self.subsoil.soil_polygons[0].soil_type, expected_soil_polygons[0].soil_type)
-        self.assertEqual(self.subsoil.soil_polygons[1].soil_type, expected_soil_polygons[1].soil_type)
-    
-    def test_remove_soil_polygons_no_overlap(self):
-        remove_polygons = [
-            Polygon([(0, 0), (0, -1), (1, -1), (1, 0)])
-        ]
-        # We expect the subsoil to not change
-        expected_soil_polygons = deepcopy(self.subsoil.soil_polygons)
-        self.subsoil.remove_polygons(remove_polygons)
-        
-        # Starting point could be different, so we take the set and check if each point is present
-        # The point order actually changes because there is a line intersection, but the geometry stays the same
-        self.assertEqual(set(self.subsoil.soil_polygons[0].points), set(expected_soil_polygons[0].points))
-        self.assertEqual(set(self.subsoil.soil_polygons[1].points), set(expected_soil_polygons[1].points))
+        for case in cases:
+            with self.subTest(case=case["case"]):
+                subsoil = deepcopy(self.subsoil)
+                subsoil.remove_polygons(case["remove_polygons"])
+                self.assertEqual(len(subsoil.soil_polygons), 2)
 
-        # Check if the is_aquifer attribute is correct
-        self.assertEqual(self.subsoil.soil_polygons[0].is_aquifer, expected_soil_polygons[0].is_aquifer)
-        self.assertEqual(self.subsoil.soil_polygons[1].is_aquifer, expected_soil_polygons[1].is_aquifer)
+                for soil_polygon, original, expected_points in zip(
+                    subsoil.soil_polygons, self.subsoil.soil_polygons, case["expected_points"]
+                ):
+                    # Starting point and orientation could be different, so we compare the canonical points
+                    expected = SoilPolygon(soil_type=original.soil_type, points=expected_points)
+                    self.assertEqual(soil_polygon.canonical_points(), expected.canonical_points())
 
-        # Check if the soil type is correct
-        self.assertEqual(self.subsoil.soil_polygons[0].soil_type, expected_soil_polygons[0].soil_type)
-        self.assertEqual(self.subsoil.soil_polygons[1].soil_type, expected_soil_polygons[1].soil_type)
+                    # Check if the soil type and is_aquifer attribute are correct
+                    self.assertEqual(soil_polygon.soil_type, original.soil_type)
+                    self.assertEqual(soil_polygon.is_aquifer, original.is_aquifer)
 
 
 class TestSubsoilFromSoilProfiles(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The soil profiles are not modified by the tests
+        cls.soil_profiles = RawInputToUserInputStructure.convert_soil_profile_collection(
+            soil_profile_dict=SOIL_PROFILE_COLLECTION_DICT
+        ).profiles
+
     def setUp(self):
         profile_points = [
             Point(x=8, y=6, z=0, l=0),
@@ -198,13 +222,6 @@ class TestSubsoilFromSoilProfiles(TestCase):
         ]
         self.surface_line = SurfaceLine(name="test", points=profile_points)
 
-        with open(SOIL_PROFILE_COLLECTION_JSON_PATH, "r") as f:
-            self.soil_profile_collection_dict = json.load(f)
-
-        self.soil_profiles = RawInputToUserInputStructure.convert_soil_profile_collection(
-            soil_profile_dict=self.soil_profile_collection_dict
-        ).profiles
-
     def test_single_profile(self):
         subsoil = subsoil_from_soil_profiles(self.surface_line, [self.soil_profiles[0]])
         self.assertIsInstance(subsoil, Subsoil)
@@ -264,13 +281,7 @@ class TestSubsoilFromSoilProfiles(TestCase):
         )
         bottom_layer_top = self.soil_profiles[0].layers[-1].top
 
-        z_min = min(
-            [
-                point[1]
-                for soil_poly in subsoil.soil_polygons
-                for point in soil_poly.points
-            ]
-        )
+        z_min = subsoil.get_bottom()
         self.assertAlmostEqual(z_min, bottom_layer_top - min_layer_thickness)
 
     def test_bottom_with_minimum_depth(self):
@@ -284,11 +295,16 @@ class TestSubsoilFromSoilProfiles(TestCase):
             min_soil_profile_depth=minimum_depth,
         )
 
-        z_min = min(
-            [
-                point[1]
-                for soil_poly in subsoil.soil_polygons
-                for point in soil_poly.points
-            ]
-        )
+        z_min = subsoil.get_bottom()
         self.assertAlmostEqual(z_min, minimum_depth)
+
+        # The cached bottom is updated when polygons are added, removed or the list is replaced
+        deep_polygon = SoilPolygon(soil_type="soil_type_1", points=[(0, -30), (1, -30), (1, -25)])
+        subsoil.add_polygons([deep_polygon])
+        self.assertAlmostEqual(subsoil.get_bottom(), -30)
+
+        subsoil.remove_polygons([Polygon([(-1, -31), (2, -31), (2, -27), (-1, -27)])])
+        self.assertAlmostEqual(subsoil.get_bottom(), -27)
+
+        subsoil.soil_polygons = subsoil.soil_polygons[:-1]
+        self.assertAlmostEqual(subsoil.get_bottom(), minimum_depth)
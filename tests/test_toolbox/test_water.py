@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from bolus.toolbox.waternet import HeadLine, ReferenceLine, Waternet
 
 
@@ -10,6 +12,23 @@ class TestHeadLine(TestCase):
             name="test_headline", is_phreatic=True, l=[0.0, 1.0, 2.0], z=[0.0, 1.0, 2.0]
         )
 
+    def test_get_z_at_l(self):
+        head_line = HeadLine(
+            name="test_headline", is_phreatic=True, l=[2.0, 1.0, 0.0], z=[4.0, 2.0, 0.0]
+        )
+        self.assertEqual(head_line.get_z_at_l(0.5), 1.0)
+        self.assertEqual(head_line.get_z_at_l(np.array([0.5, 1.5])).tolist(), [1.0, 3.0])
+
+        with self.assertRaises(ValueError):
+            head_line.get_z_at_l(2.5)
+
+        # Replacing or changing the coordinates is taken into account
+        head_line.z = [2.0, 1.0, 0.0]
+        self.assertEqual(head_line.get_z_at_l(0.5), 0.5)
+
+        head_line.z[2] = 1.0
+        self.assertEqual(head_line.get_z_at_l(0.5), 1.0)
+
 
 class TestReferenceLine(TestCase):
     def test_create_reference_line(self):
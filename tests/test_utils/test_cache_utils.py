@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from pydantic import BaseModel, PrivateAttr
+
+from bolus.utils.cache_utils import ModelCache
+
+
+class Model(BaseModel):
+    value: int
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
+
+
+class TestModelCache(TestCase):
+
+    def test_equality(self):
+        model = Model(value=1)
+        model._cache["key"] = 1
+
+        self.assertEqual(model, Model(value=1))
+        self.assertNotEqual(model, Model(value=2))
+        self.assertEqual(model.model_dump(), {"value": 1})
+
+    def test_copy(self):
+        model = Model(value=1)
+        model._cache["key"] = 1
+
+        self.assertEqual(len(model.model_copy(deep=True)._cache), 0)
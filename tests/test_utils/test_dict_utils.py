@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from bolus.utils.dict_utils import group_dicts_by_key
+
+
+class TestGroupDictsByKey(TestCase):
+
+    def test_basic_case(self):
+        dicts = [{"a": 1, "b": 12}, {"a": 2, "b": 63}, {"a": 1, "b": 56}]
+        result = group_dicts_by_key(dicts=dicts, group_by_key="a")
+        expected = {1: [{"b": 12}, {"b": 56}], 2: [{"b": 63}]}
+
+        self.assertEqual(result, expected)
+        self.assertEqual(list(result), [1, 2])  # Order of first occurrence
+
+    def test_keep_group_key(self):
+        dicts = [{"a": 1, "b": 12}, {"a": 2, "b": 63}]
+        result = group_dicts_by_key(dicts=dicts, group_by_key="a", remove_group_key=False)
+        expected = {1: [{"a": 1, "b": 12}], 2: [{"a": 2, "b": 63}]}
+
+        self.assertEqual(result, expected)
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            group_dicts_by_key(dicts=[{"b": 12}], group_by_key="a")
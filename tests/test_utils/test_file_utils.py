@@ -1,3 +1,4 @@
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -44,6 +45,49 @@ class TestGetFilesByExtension(TestCase):
             {"name": self.test_file3.name, "path": str(self.test_file3)}, files
         )
 
+    def test_get_files_by_extension_skips_directories(self):
+        (self.temp_dir / "folder.txt").mkdir()
+
+        files = get_files_by_extension(str(self.temp_dir), ".txt")
+        self.assertEqual(len(files), 2)
+
+    def test_get_files_by_extension_case(self):
+        test_file4 = self.temp_dir / "TEST4.TXT"
+        test_file4.touch()
+
+        files = get_files_by_extension(str(self.temp_dir), "txt")
+
+        # The case of the extension only matters on platforms with case-sensitive paths
+        if os.path.normcase("A") == "a":
+            self.assertEqual(len(files), 3)
+            self.assertIn({"name": test_file4.name, "path": str(test_file4)}, files)
+        else:
+            self.assertEqual(len(files), 2)
+
+    def test_get_files_by_extension_order(self):
+        nested_dir = self.test_subdir / "nested"
+        nested_dir.mkdir()
+        test_file4 = nested_dir / "test4.txt"
+        test_file4.touch()
+        test_subdir_2 = self.temp_dir / "subdir_2"
+        test_subdir_2.mkdir()
+        test_file5 = test_subdir_2 / "test5.txt"
+        test_file5.touch()
+
+        paths = [
+            file["path"]
+            for file in get_files_by_extension(str(self.temp_dir), "txt", search_sub_dir=True)
+        ]
+
+        # First the files in the directory itself, then those in the subdirectories
+        # (depth-first). The order within a directory depends on the file system.
+        self.assertCountEqual(paths[:2], [str(self.test_file1), str(self.test_file2)])
+
+        if paths.index(str(self.test_file3)) < paths.index(str(test_file5)):
+            self.assertEqual(paths[2:], [str(self.test_file3), str(test_file4), str(test_file5)])
+        else:
+            self.assertEqual(paths[2:], [str(test_file5), str(self.test_file3), str(test_file4)])
+
     def test_get_files_by_extension_invalid_dir(self):
         with self.assertRaises(ValueError):
             get_files_by_extension("invalid_dir", "txt")
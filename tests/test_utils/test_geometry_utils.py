@@ -5,7 +5,8 @@ from bolus.utils.geometry_utils import (
     geometry_to_points,
     offset_line,
     is_valid_polygon,
-    linear_interpolation
+    linear_interpolation,
+    linear_interpolation_many
 )
 
 
@@ -79,6 +80,15 @@ class TestGeometryUtils(unittest.TestCase):
         y = [10.0, 6.0, 2.0]
         self.assertEqual(linear_interpolation(4.0, x, y), 8.0)
 
+    def test_linear_interpolation_two_points(self):
+        self.assertEqual(linear_interpolation(0.5, [0.0, 2.0], [1.0, 3.0]), 1.5)
+        self.assertEqual(linear_interpolation(0.5, [2.0, 0.0], [3.0, 1.0]), 1.5)
+
+        with self.assertRaises(ValueError):
+            linear_interpolation(2.5, [2.0, 0.0], [3.0, 1.0])
+        with self.assertRaises(ValueError):
+            linear_interpolation(1.0, [1.0, 1.0], [3.0, 1.0])
+
     def test_linear_interpolation_out_of_range_raises(self):
         x = [0.0, 1.0, 2.0]
         y = [0.0, 1.0, 2.0]
@@ -99,4 +109,13 @@ class TestGeometryUtils(unittest.TestCase):
         x = [0.0, 1.0, 1.0, 2.0]
         y = [0.0, 1.0, 1.0, 2.0]
         with self.assertRaises(ValueError):
-            linear_interpolation(1.5, x, y)
\ No newline at end of file
+            linear_interpolation(1.5, x, y)
+
+    def test_linear_interpolation_many(self):
+        x = [5.0, 3.0, 1.0]
+        y = [10.0, 6.0, 2.0]
+        result = linear_interpolation_many([1.0, 2.0, 4.0, 5.0], x, y)
+        self.assertEqual(result.tolist(), [2.0, 4.0, 8.0, 10.0])
+
+        with self.assertRaises(ValueError):
+            linear_interpolation_many([0.0, 2.0], x, y)
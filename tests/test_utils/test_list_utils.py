@@ -1,6 +1,20 @@
 from unittest import TestCase
 
-from bolus.utils.list_utils import get_list_item_indices
+from pydantic import BaseModel, PrivateAttr
+
+from bolus.utils.cache_utils import ModelCache
+from bolus.utils.list_utils import find_by_name, get_list_item_indices
+
+
+class Item(BaseModel):
+    name: str
+    value: int = 0
+
+
+class Collection(BaseModel):
+    items: list[Item]
+
+    _cache: ModelCache = PrivateAttr(default_factory=ModelCache)
 
 
 class TestGetListItemIndices(TestCase):
@@ -13,9 +27,64 @@ class TestGetListItemIndices(TestCase):
 
         self.assertEqual(result, expected)
 
+    def test_duplicate_values(self):
+        li = ["eerste", "tweede", "eerste"]
+        di = {"first": "eerste"}
+
+        self.assertEqual(get_list_item_indices(li, di), {"first": 0})
+
     def test_empty_list(self):
         li: list[str] = []
         di = {"first": "eerste", "second": "tweede", "third": "derde"}
 
         with self.assertRaises(ValueError):
             get_list_item_indices(li, di)
+
+
+class TestFindByName(TestCase):
+
+    def setUp(self):
+        self.collection = Collection(items=[Item(name="a"), Item(name="b"), Item(name="a", value=1)])
+        self.cache = self.collection._cache
+
+    def test_basic_case(self):
+        self.assertIs(find_by_name(self.cache, self.collection.items, "b"), self.collection.items[1])
+        self.assertIs(find_by_name(self.cache, self.collection.items, "a"), self.collection.items[0])
+        self.assertIsNone(find_by_name(self.cache, self.collection.items, "c"))
+
+        # The cached lookup doesn't affect the comparison and serialisation
+        self.assertEqual(self.collection, Collection(**self.collection.model_dump()))
+
+    def test_changes_after_lookup(self):
+        find_by_name(self.cache, self.collection.items, "b")
+
+        self.collection.items[1].name = "c"
+        self.assertIsNone(find_by_name(self.cache, self.collection.items, "b"))
+        self.assertIs(find_by_name(self.cache, self.collection.items, "c"), self.collection.items[1])
+
+        self.collection.items.append(Item(name="d"))
+        self.assertIs(find_by_name(self.cache, self.collection.items, "d"), self.collection.items[-1])
+
+        # An item replaced by another item with the same name
+        self.collection.items[1] = Item(name="c", value=2)
+        self.assertIs(find_by_name(self.cache, self.collection.items, "c"), self.collection.items[1])
+
+        # An item removed and added again at the end, the length is unchanged
+        item = self.collection.items.pop(1)
+        self.collection.items.append(item)
+        self.assertIs(find_by_name(self.cache, self.collection.items, "c"), self.collection.items[-1])
+
+        # The list replaced by another list
+        self.collection.items = [Item(name="e")]
+        self.assertIs(find_by_name(self.cache, self.collection.items, "e"), self.collection.items[0])
+
+    def test_name_attr(self):
+        self.assertIs(
+            find_by_name(self.cache, self.collection.items, 1, name_attr="value"),
+            self.collection.items[2],
+        )
+        self.assertIsNone(find_by_name(self.cache, self.collection.items, 2, name_attr="value"))
+
+        # The lookups per attribute are kept side by side
+        self.assertIs(find_by_name(self.cache, self.collection.items, "b"), self.collection.items[1])
+        self.assertEqual(len(self.cache), 2)